@@ -5,10 +5,4 @@ A Model Context Protocol server for NBA player statistics from basketball-refere
 
 __version__ = "0.1.0"
 __author__ = "Ziyad Mir"
-__email__ = "ziyadmir@gmail.com"
-
-# Import the fix automatically when the package is imported
-try:
-    import fix_basketball_reference
-except ImportError:
-    pass
\ No newline at end of file
+__email__ = "ziyadmir@gmail.com"
\ No newline at end of file
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Build a local corpus of NBA player stats
+
+Fetches every requested player's tables once through fix_basketball_reference, which also
+warms the on-disk cache used by the MCP server, and writes them all to a single file with
+one row per player-season and PLAYER / STAT_TYPE columns.
+
+Usage:
+    python build_corpus.py "LeBron James" "Stephen Curry"
+    python build_corpus.py --players-file players.txt --stat-types PER_GAME ADVANCED -o nba_corpus.parquet
+"""
+
+import argparse
+
+from fix_basketball_reference import get_stats_fixed
+import pandas as pd
+
+STAT_TYPES = ['PER_GAME', 'TOTALS', 'ADVANCED']
+
+
+def build_corpus(names, stat_types=STAT_TYPES, playoffs=False):
+    """Concatenate every player's tables into one DataFrame tagged with PLAYER and STAT_TYPE"""
+    frames = []
+    for name in names:
+        for stat_type in stat_types:
+            try:
+                df = get_stats_fixed(name, stat_type=stat_type, playoffs=playoffs, ask_matches=False)
+            except Exception as e:
+                print(f"Skipping {name} ({stat_type}): {e}")
+                continue
+            if not df.empty:
+                frames.append(df.assign(PLAYER=name, STAT_TYPE=stat_type))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('players', nargs='*', help='Player names to fetch')
+    parser.add_argument('--players-file', help='File with one player name per line')
+    parser.add_argument('--stat-types', nargs='+', default=STAT_TYPES, help='Stat tables to fetch')
+    parser.add_argument('--playoffs', action='store_true', help='Fetch playoff tables instead')
+    parser.add_argument('-o', '--output', default='nba_corpus.csv',
+                        help='Output file, .parquet needs pyarrow or fastparquet installed')
+    args = parser.parse_args()
+
+    names = list(args.players)
+    if args.players_file:
+        with open(args.players_file) as f:
+            names.extend(line.strip() for line in f if line.strip())
+    if not names:
+        parser.error('no players given')
+
+    corpus = build_corpus(names, args.stat_types, args.playoffs)
+    if args.output.endswith('.parquet'):
+        corpus.to_parquet(args.output, index=False)
+    else:
+        corpus.to_csv(args.output, index=False)
+    print(f"Wrote {len(corpus)} rows for {corpus['PLAYER'].nunique() if len(corpus) else 0} players to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
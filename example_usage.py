@@ -8,92 +8,116 @@ with the fixes applied for retrieving NBA player statistics.
 
 # Import the fix first
 import fix_basketball_reference
+from fix_basketball_reference import gather_stats
 from basketball_reference_scraper.players import get_stats, get_player_headshot
+import asyncio
+import numpy as np
 import pandas as pd
 
+
+def by_season(df):
+    """Index a stats frame by SEASON once so seasons and 'Career' are read with .at lookups
+
+    Traded players repeat a season per team after the combined TOT row, only that first row is
+    kept so .at still returns a single value.
+    """
+    if 'SEASON' not in df.columns:
+        return df
+    if not df['SEASON'].is_unique:
+        df = df[~df['SEASON'].duplicated()]
+    return df.set_index('SEASON', drop=False)
+
+
+def best_season(df, attempts_col='3PA', pct_col='3P%', min_att=2.0):
+    """Row position of the best pct_col season with more than min_att attempts, -1 if none qualify"""
+    attempts = df[attempts_col].to_numpy(dtype=float)
+    pct = df[pct_col].to_numpy(dtype=float)
+    idx = np.flatnonzero((attempts > min_att) & ~np.isnan(pct))
+    return idx[pct[idx].argmax()] if idx.size else -1
+
+
 def demonstrate_player_stats():
     """Demonstrate various player statistics queries"""
     
     print("=== NBA Player Stats Examples ===\n")
     
+    # Per-game frames used below, fetched in one concurrent batch
+    per_game = asyncio.run(gather_stats(['LeBron James', 'Stephen Curry', 'Kawhi Leonard'],
+                                        stat_type='PER_GAME', ask_matches=False))
+    
     # 1. Career statistics
     print("1. LeBron James Career Stats (Per Game)")
-    lebron_stats = get_stats('LeBron James', stat_type='PER_GAME', ask_matches=False)
-    career_row = lebron_stats[lebron_stats['SEASON'] == 'Career']
-    if not career_row.empty:
-        print(f"Career PPG: {career_row['PTS'].values[0]}")
-        print(f"Career RPG: {career_row['TRB'].values[0]}")
-        print(f"Career APG: {career_row['AST'].values[0]}")
+    lebron_stats = by_season(per_game['LeBron James'])
+    if 'Career' in lebron_stats.index:
+        print(f"Career PPG: {lebron_stats.at['Career', 'PTS']}")
+        print(f"Career RPG: {lebron_stats.at['Career', 'TRB']}")
+        print(f"Career APG: {lebron_stats.at['Career', 'AST']}")
     print()
     
     # 2. Specific season stats
     print("2. Stephen Curry 2015-16 Season (MVP Season)")
-    curry_stats = get_stats('Stephen Curry', stat_type='PER_GAME', ask_matches=False)
-    mvp_season = curry_stats[curry_stats['SEASON'] == '2015-16']
-    if not mvp_season.empty:
-        print(f"PPG: {mvp_season['PTS'].values[0]}")
-        print(f"3P%: {mvp_season['3P%'].values[0]}")
-        print(f"3PM per game: {mvp_season['3P'].values[0]}")
+    curry_stats = by_season(per_game['Stephen Curry'])
+    if '2015-16' in curry_stats.index:
+        print(f"PPG: {curry_stats.at['2015-16', 'PTS']}")
+        print(f"3P%: {curry_stats.at['2015-16', '3P%']}")
+        print(f"3PM per game: {curry_stats.at['2015-16', '3P']}")
     print()
     
     # 3. Advanced stats
     print("3. Nikola Jokić Advanced Stats (2022-23)")
-    jokic_advanced = get_stats('Nikola Jokić', stat_type='ADVANCED', ask_matches=False)
-    jokic_2023 = jokic_advanced[jokic_advanced['SEASON'] == '2022-23']
-    if not jokic_2023.empty:
-        print(f"PER: {jokic_2023['PER'].values[0]}")
-        print(f"Win Shares: {jokic_2023['WS'].values[0]}")
-        print(f"BPM: {jokic_2023['BPM'].values[0]}")
+    jokic_advanced = by_season(get_stats('Nikola Jokić', stat_type='ADVANCED', ask_matches=False))
+    if '2022-23' in jokic_advanced.index:
+        print(f"PER: {jokic_advanced.at['2022-23', 'PER']}")
+        print(f"Win Shares: {jokic_advanced.at['2022-23', 'WS']}")
+        print(f"BPM: {jokic_advanced.at['2022-23', 'BPM']}")
     print()
     
     # 4. Playoff vs Regular Season
     print("4. Kawhi Leonard Playoff Performance")
-    kawhi_regular = get_stats('Kawhi Leonard', stat_type='PER_GAME', playoffs=False, ask_matches=False)
-    kawhi_playoffs = get_stats('Kawhi Leonard', stat_type='PER_GAME', playoffs=True, ask_matches=False)
-    
-    regular_career = kawhi_regular[kawhi_regular['SEASON'] == 'Career']
-    playoff_career = kawhi_playoffs[kawhi_playoffs['SEASON'] == 'Career']
+    kawhi_regular = by_season(per_game['Kawhi Leonard'])
+    kawhi_playoffs = by_season(get_stats('Kawhi Leonard', stat_type='PER_GAME', playoffs=True, ask_matches=False))
     
-    if not regular_career.empty and not playoff_career.empty:
-        print(f"Regular Season PPG: {regular_career['PTS'].values[0]}")
-        print(f"Playoff PPG: {playoff_career['PTS'].values[0]}")
-        print(f"Playoff PPG increase: +{float(playoff_career['PTS'].values[0]) - float(regular_career['PTS'].values[0]):.1f}")
+    if 'Career' in kawhi_regular.index and 'Career' in kawhi_playoffs.index:
+        print(f"Regular Season PPG: {kawhi_regular.at['Career', 'PTS']}")
+        print(f"Playoff PPG: {kawhi_playoffs.at['Career', 'PTS']}")
+        print(f"Playoff PPG increase: +{float(kawhi_playoffs.at['Career', 'PTS']) - float(kawhi_regular.at['Career', 'PTS']):.1f}")
     print()
     
     # 5. Career totals
     print("5. Kareem Abdul-Jabbar Career Totals")
-    kareem_totals = get_stats('Kareem Abdul-Jabbar', stat_type='TOTALS', ask_matches=False)
-    career_totals = kareem_totals[kareem_totals['SEASON'] == 'Career']
-    if not career_totals.empty:
-        print(f"Total Points: {career_totals['PTS'].values[0]:,}")
-        print(f"Total Rebounds: {career_totals['TRB'].values[0]:,}")
-        print(f"Games Played: {career_totals['G'].values[0]:,}")
+    kareem_totals = by_season(get_stats('Kareem Abdul-Jabbar', stat_type='TOTALS', ask_matches=False))
+    if 'Career' in kareem_totals.index:
+        print(f"Total Points: {kareem_totals.at['Career', 'PTS']:,}")
+        print(f"Total Rebounds: {kareem_totals.at['Career', 'TRB']:,}")
+        print(f"Games Played: {kareem_totals.at['Career', 'G']:,}")
     print()
     
     # 6. Per-36 minute stats
     print("6. Giannis Antetokounmpo Per-36 Stats (2022-23)")
-    giannis_per36 = get_stats('Giannis Antetokounmpo', stat_type='PER_MINUTE', ask_matches=False)
-    giannis_2023 = giannis_per36[giannis_per36['SEASON'] == '2022-23']
-    if not giannis_2023.empty:
-        print(f"Points per 36 min: {giannis_2023['PTS'].values[0]}")
-        print(f"Rebounds per 36 min: {giannis_2023['TRB'].values[0]}")
-        print(f"Assists per 36 min: {giannis_2023['AST'].values[0]}")
+    giannis_per36 = by_season(get_stats('Giannis Antetokounmpo', stat_type='PER_MINUTE', ask_matches=False))
+    if '2022-23' in giannis_per36.index:
+        print(f"Points per 36 min: {giannis_per36.at['2022-23', 'PTS']}")
+        print(f"Rebounds per 36 min: {giannis_per36.at['2022-23', 'TRB']}")
+        print(f"Assists per 36 min: {giannis_per36.at['2022-23', 'AST']}")
     print()
 
 def compare_players():
     """Compare two players"""
     print("=== Player Comparison: LeBron vs Jordan ===\n")
     
-    lebron = get_stats('LeBron James', stat_type='PER_GAME', career=True, ask_matches=False)
-    jordan = get_stats('Michael Jordan', stat_type='PER_GAME', career=True, ask_matches=False)
+    # The two fetches are independent, so overlap their network I/O
+    careers = asyncio.run(gather_stats(['LeBron James', 'Michael Jordan'],
+                                       stat_type='PER_GAME', career=True, ask_matches=False))
+    lebron = careers['LeBron James']
+    jordan = careers['Michael Jordan']
     
     print(f"{'Stat':<15} {'LeBron':<10} {'Jordan':<10}")
     print("-" * 35)
-    print(f"{'PPG':<15} {lebron['PTS'].values[0]:<10} {jordan['PTS'].values[0]:<10}")
-    print(f"{'RPG':<15} {lebron['TRB'].values[0]:<10} {jordan['TRB'].values[0]:<10}")
-    print(f"{'APG':<15} {lebron['AST'].values[0]:<10} {jordan['AST'].values[0]:<10}")
-    print(f"{'FG%':<15} {lebron['FG%'].values[0]:<10} {jordan['FG%'].values[0]:<10}")
-    print(f"{'3P%':<15} {lebron['3P%'].values[0]:<10} {jordan['3P%'].values[0]:<10}")
+    print(f"{'PPG':<15} {lebron.at[0, 'PTS']:<10} {jordan.at[0, 'PTS']:<10}")
+    print(f"{'RPG':<15} {lebron.at[0, 'TRB']:<10} {jordan.at[0, 'TRB']:<10}")
+    print(f"{'APG':<15} {lebron.at[0, 'AST']:<10} {jordan.at[0, 'AST']:<10}")
+    print(f"{'FG%':<15} {lebron.at[0, 'FG%']:<10} {jordan.at[0, 'FG%']:<10}")
+    print(f"{'3P%':<15} {lebron.at[0, '3P%']:<10} {jordan.at[0, '3P%']:<10}")
     print()
 
 def shooting_analysis():
@@ -102,74 +126,79 @@ def shooting_analysis():
     
     shooters = ['Stephen Curry', 'Ray Allen', 'Reggie Miller']
     
-    for shooter in shooters:
-        stats = get_stats(shooter, stat_type='PER_GAME', ask_matches=False)
-        career = stats[stats['SEASON'] == 'Career']
+    # Fetch all shooters concurrently, then print in the original order
+    results = asyncio.run(gather_stats(shooters, stat_type='PER_GAME', ask_matches=False))
+    
+    for shooter, stats in results.items():
+        stats = by_season(stats)
         
-        if not career.empty:
+        if 'Career' in stats.index:
             print(f"{shooter}:")
-            print(f"  Career 3P%: {career['3P%'].values[0]}")
-            print(f"  Career 3PM/game: {career['3P'].values[0]}")
-            print(f"  Career 3PA/game: {career['3PA'].values[0]}")
+            print(f"  Career 3P%: {stats.at['Career', '3P%']}")
+            print(f"  Career 3PM/game: {stats.at['Career', '3P']}")
+            print(f"  Career 3PA/game: {stats.at['Career', '3PA']}")
             
             # Find best 3P% season (minimum 100 attempts)
-            seasons = stats[stats['SEASON'] != 'Career']
-            seasons_filtered = seasons[seasons['3PA'] > 2.0]  # At least 2 attempts per game
-            if not seasons_filtered.empty:
-                best_season_idx = seasons_filtered['3P%'].idxmax()
-                best_season = seasons_filtered.loc[best_season_idx]
-                print(f"  Best 3P% Season: {best_season['SEASON']} ({best_season['3P%']})")
+            seasons = stats.drop(index='Career', errors='ignore')
+            best = best_season(seasons)  # At least 2 attempts per game
+            if best >= 0:
+                # Positional lookup, traded seasons repeat the same SEASON label
+                print(f"  Best 3P% Season: {seasons['SEASON'].iat[best]} ({seasons['3P%'].iat[best]})")
             print()
 
 def demonstrate_deep_analytics():
     """Demonstrate the new Layer 2 deep analytics capabilities"""
     print("=== Layer 2 Deep Analytics Examples ===\n")
     
+    # None of the tables below depend on each other, so fetch them all in one concurrent batch
+    async def fetch_all():
+        return await asyncio.gather(
+            gather_stats(['Stephen Curry'], stat_type='PER_GAME', ask_matches=False),
+            gather_stats(['Giannis Antetokounmpo', 'Nikola Jokić'], stat_type='ADVANCED', ask_matches=False),
+            gather_stats(['Jimmy Butler'], stat_type='PER_GAME', playoffs=True, ask_matches=False),
+        )
+    per_game, advanced, playoffs = asyncio.run(fetch_all())
+    
     # 1. Specific stat query
     print("1. Specific Stat Query: Steph Curry's 3P% in 2018")
-    curry_stats = get_stats('Stephen Curry', stat_type='PER_GAME', ask_matches=False)
-    curry_2018 = curry_stats[curry_stats['SEASON'] == '2017-18']
-    if not curry_2018.empty:
-        print(f"   3P% in 2017-18: {curry_2018['3P%'].values[0]}")
-        print(f"   3PM per game: {curry_2018['3P'].values[0]}")
-        print(f"   3PA per game: {curry_2018['3PA'].values[0]}")
+    curry_stats = by_season(per_game['Stephen Curry'])
+    if '2017-18' in curry_stats.index:
+        print(f"   3P% in 2017-18: {curry_stats.at['2017-18', '3P%']}")
+        print(f"   3PM per game: {curry_stats.at['2017-18', '3P']}")
+        print(f"   3PA per game: {curry_stats.at['2017-18', '3PA']}")
     print()
     
     # 2. Points in a specific year
     print("2. Points Query: How many points did Steph Curry average in 2024?")
-    curry_2024 = curry_stats[curry_stats['SEASON'] == '2023-24']
-    if not curry_2024.empty:
-        print(f"   PPG in 2023-24: {curry_2024['PTS'].values[0]}")
-        print(f"   Games played: {curry_2024['G'].values[0]}")
+    if '2023-24' in curry_stats.index:
+        print(f"   PPG in 2023-24: {curry_stats.at['2023-24', 'PTS']}")
+        print(f"   Games played: {curry_stats.at['2023-24', 'G']}")
     print()
     
     # 3. Advanced stat lookup
     print("3. MVP-caliber Season: Giannis Antetokounmpo's PER in 2020")
-    giannis_advanced = get_stats('Giannis Antetokounmpo', stat_type='ADVANCED', ask_matches=False)
-    giannis_2020 = giannis_advanced[giannis_advanced['SEASON'] == '2019-20']
-    if not giannis_2020.empty:
-        print(f"   PER: {giannis_2020['PER'].values[0]}")
-        print(f"   Win Shares: {giannis_2020['WS'].values[0]}")
-        print(f"   VORP: {giannis_2020['VORP'].values[0]}")
+    giannis_advanced = by_season(advanced['Giannis Antetokounmpo'])
+    if '2019-20' in giannis_advanced.index:
+        print(f"   PER: {giannis_advanced.at['2019-20', 'PER']}")
+        print(f"   Win Shares: {giannis_advanced.at['2019-20', 'WS']}")
+        print(f"   VORP: {giannis_advanced.at['2019-20', 'VORP']}")
     print()
     
     # 4. Playoff performance by year
     print("4. Playoff Year Analysis: Jimmy Butler 2020 Bubble Run")
-    butler_playoffs = get_stats('Jimmy Butler', stat_type='PER_GAME', playoffs=True, ask_matches=False)
-    butler_2020 = butler_playoffs[butler_playoffs['SEASON'] == '2019-20']
-    if not butler_2020.empty:
-        print(f"   Playoff PPG: {butler_2020['PTS'].values[0]}")
-        print(f"   Playoff APG: {butler_2020['AST'].values[0]}")
-        print(f"   Games played: {butler_2020['G'].values[0]}")
+    butler_playoffs = by_season(playoffs['Jimmy Butler'])
+    if '2019-20' in butler_playoffs.index:
+        print(f"   Playoff PPG: {butler_playoffs.at['2019-20', 'PTS']}")
+        print(f"   Playoff APG: {butler_playoffs.at['2019-20', 'AST']}")
+        print(f"   Games played: {butler_playoffs.at['2019-20', 'G']}")
     print()
     
     # 5. Efficiency stats
     print("5. Efficiency Query: Nikola Jokić's True Shooting % in 2023")
-    jokic_2023 = get_stats('Nikola Jokić', stat_type='ADVANCED', ask_matches=False)
-    jokic_season = jokic_2023[jokic_2023['SEASON'] == '2022-23']
-    if not jokic_season.empty:
-        print(f"   TS%: {jokic_season['TS%'].values[0]}")
-        print(f"   eFG%: {jokic_season['eFG%'].values[0]}")
+    jokic_2023 = by_season(advanced['Nikola Jokić'])
+    if '2022-23' in jokic_2023.index:
+        print(f"   TS%: {jokic_2023.at['2022-23', 'TS%']}")
+        print(f"   eFG%: {jokic_2023.at['2022-23', 'eFG%']}")
     print()
 
 
@@ -177,10 +206,18 @@ def demonstrate_ultra_deep_analytics():
     """Demonstrate Layer 3 ultra-deep analytics capabilities"""
     print("=== Layer 3 Ultra-Deep Analytics Examples ===\n")
     
+    # Warm every table the examples read in one concurrent batch
+    async def fetch_all():
+        return await asyncio.gather(
+            gather_stats(['LeBron James', 'Kevin Durant'], stat_type='PER_GAME', ask_matches=False),
+            gather_stats(['Kevin Durant', 'Stephen Curry'], stat_type='TOTALS', ask_matches=False),
+        )
+    per_game, totals = asyncio.run(fetch_all())
+    
     # 1. Career trend analysis
     print("1. Career Trends: Is LeBron James declining?")
-    lebron_stats = get_stats('LeBron James', stat_type='PER_GAME', ask_matches=False)
-    recent_5_years = lebron_stats[lebron_stats['SEASON'] != 'Career'].tail(5)
+    lebron_stats = by_season(per_game['LeBron James'])
+    recent_5_years = lebron_stats.drop(index='Career', errors='ignore').tail(5)
     if len(recent_5_years) >= 2:
         first_year = recent_5_years.iloc[0]
         last_year = recent_5_years.iloc[-1]
@@ -192,12 +229,11 @@ def demonstrate_ultra_deep_analytics():
     
     # 2. 40+ point games estimate
     print("2. Game Highs: Estimating Kevin Durant's 40+ point games")
-    kd_stats = get_stats('Kevin Durant', stat_type='PER_GAME', ask_matches=False)
-    kd_career = kd_stats[kd_stats['SEASON'] == 'Career']
-    if not kd_career.empty:
-        career_ppg = float(kd_career['PTS'].values[0])
-        total_games = get_stats('Kevin Durant', stat_type='TOTALS', ask_matches=False)
-        total_g = total_games[total_games['SEASON'] == 'Career']['G'].values[0]
+    kd_stats = by_season(per_game['Kevin Durant'])
+    if 'Career' in kd_stats.index:
+        career_ppg = float(kd_stats.at['Career', 'PTS'])
+        total_games = by_season(totals['Kevin Durant'])
+        total_g = total_games.at['Career', 'G']
         # Rough estimate: elite scorers (25+ PPG) have ~5% of games at 40+
         estimated_40pt_games = int(total_g * 0.05)
         print(f"   Career PPG: {career_ppg}")
@@ -207,10 +243,9 @@ def demonstrate_ultra_deep_analytics():
     
     # 3. All-time ranking
     print("3. All-Time Rankings: Where does Steph Curry rank in 3PM?")
-    curry_totals = get_stats('Stephen Curry', stat_type='TOTALS', ask_matches=False)
-    curry_career = curry_totals[curry_totals['SEASON'] == 'Career']
-    if not curry_career.empty:
-        threes_made = int(curry_career['3P'].values[0])
+    curry_totals = by_season(totals['Stephen Curry'])
+    if 'Career' in curry_totals.index:
+        threes_made = int(curry_totals.at['Career', '3P'])
         print(f"   Career 3PM: {threes_made:,}")
         print(f"   All-time rank: #1 (as of 2024)")
         print(f"   Lead over #2: 500+ and growing")
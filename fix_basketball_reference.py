@@ -11,87 +11,371 @@ Usage:
     stats = get_stats('LeBron James', ask_matches=False)
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from pathlib import Path
+
+import lxml.html
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from basketball_reference_scraper.utils import get_player_suffix
 from basketball_reference_scraper.lookup import lookup
-from basketball_reference_scraper.request_utils import get_wrapper, get_selenium_wrapper
-from bs4 import BeautifulSoup
-from io import StringIO
+from basketball_reference_scraper.request_utils import get_selenium_wrapper
 import basketball_reference_scraper.players as players
+import basketball_reference_scraper.request_utils as request_utils
+import basketball_reference_scraper.seasons as seasons
+import basketball_reference_scraper.utils as utils
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional, it serializes the record dicts several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One pooled session so repeated requests reuse the keep-alive TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                      raise_on_status=False),
+))
+# urllib3 only advertises the encodings it can decode, so br/zstd are added when installed
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (compatible; nba-player-stats-mcp)',
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Encoding': ACCEPT_ENCODING,
+})
+
+# basketball-reference.com rate limits aggressive clients, keep the upstream 3 second spacing
+_REQUEST_INTERVAL = 3
+_request_lock = threading.Lock()
+_last_request = 0.0
+
+# Parsed tables are cached here so repeated queries skip the HTTP fetch and HTML parse
+CACHE_DIR = Path(os.environ.get('NBA_STATS_CACHE_DIR', Path.home() / '.cache' / 'nba_stats'))
+# Cache files and pages older than this many seconds are re-fetched so new games eventually show up.
+# The server's in-memory cache reads the same setting, so its refetches never get a staler copy from here
+CACHE_TTL = float(os.environ.get('NBA_STATS_CACHE_TTL', 6 * 60 * 60))
+
+# Bump whenever the shape of the parsed DataFrame changes so stale cache files are ignored
+_CACHE_VERSION = 6
+
+# Column renames applied to every parsed table, rename skips the ones a table doesn't have
+_RENAME_MAP = {
+    'Season': 'SEASON', 'Age': 'AGE', 'Tm': 'TEAM', 'Lg': 'LEAGUE', 'Pos': 'POS', 'Awards': 'AWARDS',
+}
+
+# Stats whose percentage column older layouts label without the % sign: as a mangled duplicate
+# (FG.1), bare on rate-only stats (eFG, TS), or bare everywhere in the advanced table
+_PCT_COLS = frozenset({'FG', '3P', '2P', 'FT', 'eFG', 'TS', 'ORB', 'DRB', 'TRB', 'AST', 'STL', 'BLK', 'TOV', 'USG'})
+_RATE_ONLY = frozenset({'eFG', 'TS'})
+
+# Table ids on the new basketball-reference.com pages, playoff tables carry a _post suffix
+_TABLE_IDS = MappingProxyType({
+    (stat_type, playoffs): f'{table_id}_post' if playoffs else table_id
+    for stat_type, table_id in {
+        'per_game': 'per_game_stats',
+        'totals': 'totals_stats',
+        'per_minute': 'per_minute_stats',
+        'per_poss': 'per_poss_stats',
+        'advanced': 'advanced',
+    }.items()
+    for playoffs in (False, True)
+})
+
+def _memoize_found(func, maxsize=1024):
+    """lru_cache-style memo that never stores None, so a failed lookup is retried on the next call"""
+    cache = {}
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        with lock:
+            if args in cache:
+                return cache[args]
+        result = func(*args)
+        if result is not None:
+            with lock:
+                cache[args] = result
+                if len(cache) > maxsize:
+                    del cache[next(iter(cache))]
+        return result
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+# Name resolution scans the bundled name list and the suffix check fetches the player page,
+# so memoize both for the lifetime of the process. get_player_suffix returns None on a
+# transient non-200 as well as for unknown players, so only found suffixes are kept
+_lookup = functools.lru_cache(maxsize=1024)(lookup)
+_player_suffix = _memoize_found(get_player_suffix)
+
+
+def _session_get(url):
+    """Drop-in replacement for request_utils.get_wrapper that uses the pooled session"""
+    global _last_request
+    with _request_lock:
+        wait = _last_request + _REQUEST_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request = time.monotonic()
+    return _SESSION.get(url, timeout=(3.05, 27))
+
+
+# Every stat table of a player lives on the same page, so one download serves all of them.
+# Pages expire with the table cache so current-season numbers get refetched
+_page_lock = threading.Lock()
+_pages = {}
+_page_locks = {}
+_PAGE_CACHE_SIZE = 32
+
+
+def _fetch_player_page(url):
+    r = _session_get(url)
+    if r.status_code != 200:
+        raise ConnectionError('Request to basketball reference failed')
+    # basketball-reference ships some tables inside HTML comments, unwrap them up front
+    return r.content.replace(b'<!--', b'').replace(b'-->', b'')
+
+
+def _cached_page(url):
+    with _page_lock:
+        cached = _pages.get(url)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _player_page(url):
+    """Comment-stripped HTML of a player page, downloaded at most once per CACHE_TTL
+
+    Threads asking for the same page wait on one download, other pages are fetched concurrently.
+    """
+    page = _cached_page(url)
+    if page is not None:
+        return page
+    with _page_lock:
+        url_lock = _page_locks.setdefault(url, threading.Lock())
+    with url_lock:
+        # Another thread may have downloaded it while this one waited
+        page = _cached_page(url)
+        if page is not None:
+            return page
+        try:
+            page = _fetch_player_page(url)
+        except Exception:
+            # Nothing was cached, don't keep the lock of a page that failed to download
+            with _page_lock:
+                _page_locks.pop(url, None)
+            raise
+        with _page_lock:
+            # Re-insert so dict order stays oldest-first for eviction
+            _pages.pop(url, None)
+            _pages[url] = (time.monotonic(), page)
+            while len(_pages) > _PAGE_CACHE_SIZE:
+                oldest = next(iter(_pages))
+                del _pages[oldest]
+                if oldest in _page_locks and not _page_locks[oldest].locked():
+                    del _page_locks[oldest]
+        return page
+
+
+def _find_table(page, table_id):
+    """The <table> element with table_id, parsing only its slice of the page when possible"""
+    marker = page.find(f'id="{table_id}"'.encode())
+    start = page.rfind(b'<table', 0, marker) if marker >= 0 else -1
+    end = page.find(b'</table>', marker) if start >= 0 else -1
+    # The id must sit inside the <table ...> start tag, otherwise fall back to the full parse
+    if end < 0 or b'>' in page[start:marker]:
+        return lxml.html.fromstring(page).get_element_by_id(table_id, None)
+    return lxml.html.fromstring(page[start:end + len(b'</table>')])
 
+
+def _disk_cached(func):
+    """Cache non-empty get_stats results on disk for CACHE_TTL seconds, keyed by the call arguments
+
+    No in-memory layer: a process-lifetime memo would outlive the TTL, the server caches above this.
+    Names are keyed like the server cache, stripped and lowercased, so spellings share one file.
+    """
+    @functools.wraps(func)
+    def wrapper(_name, stat_type='PER_GAME', playoffs=False, career=False, ask_matches=True):
+        key = hashlib.sha1(
+            f"{_CACHE_VERSION}|{_name.strip().lower()}|{stat_type.lower()}|{playoffs}|{career}".encode()
+        ).hexdigest()
+        path = CACHE_DIR / f"{key}.pkl"
+        try:
+            fresh = time.time() - path.stat().st_mtime < CACHE_TTL
+        except OSError:
+            fresh = False
+        if fresh:
+            try:
+                return pd.read_pickle(path)
+            except Exception as e:
+                # Corrupt or incompatible file, drop it so it isn't re-read on every call
+                logger.warning("Discarding unreadable stats cache file %s: %s", path, e)
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+        df = func(_name, stat_type, playoffs, career, ask_matches)
+        # Empty frames usually mean a failed or rate-limited fetch, so they are never stored
+        if not df.empty:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                df.to_pickle(path)
+            except OSError:
+                # The cache is an optimization, never fail a lookup because of it
+                pass
+        return df
+
+    return wrapper
+
+
+def _row_cells(tr):
+    """Cell texts of a table row, repeating colspan cells like pd.read_html does"""
+    cells = []
+    for cell in tr.xpath('./th|./td'):
+        text = cell.text_content().strip()
+        cells.extend([text or np.nan] * int(cell.get('colspan', 1)))
+    return cells
+
+
+def _to_numeric(column):
+    """Convert a column to numbers when every value parses, otherwise leave it as text"""
+    try:
+        return pd.to_numeric(column.str.replace(',', '', regex=False))
+    except (ValueError, TypeError, AttributeError):
+        return column
+
+
+def _table_to_frame(table, career=False):
+    """Build a DataFrame straight from a <table> element without going through pd.read_html
+
+    Keeps the season rows plus the Career footer row, or only the Career row when career is set.
+    """
+    header_rows = [tr for tr in table.xpath('./thead/tr') if 'over_header' not in tr.get('class', '')]
+    columns = []
+    seen = {}
+    for i, name in enumerate(_row_cells(header_rows[-1]) if header_rows else []):
+        if pd.isna(name):
+            name = f'Unnamed: {i}'
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        columns.append(name)
+
+    # The footer also carries per-franchise "N Yrs" summaries, only the Career row is wanted
+    career_xpath = "(./tbody/tr | ./tr | ./tfoot/tr)[normalize-space(*[1])='Career']"
+    trs = table.xpath(career_xpath)[:1] if career else table.xpath(
+        "./tbody/tr | ./tr | ./tfoot/tr[normalize-space(*[1])='Career']")
+
+    rows = []
+    for tr in trs:
+        # Skip the header rows repeated every 20 seasons
+        if 'thead' in tr.get('class', '').split():
+            continue
+        cells = _row_cells(tr)[:len(columns)]
+        rows.append(cells + [np.nan] * (len(columns) - len(cells)))
+
+    return pd.DataFrame(rows, columns=columns).apply(_to_numeric)
+
+
+def _pct_name(column, advanced):
+    """Percentage name for a legacy column label, or the label unchanged"""
+    base = column[:-2] if column.endswith('.1') else column
+    if base in _PCT_COLS and (base != column or advanced or base in _RATE_ONLY):
+        return f'{base}%'
+    return column
+
+
+@_disk_cached
 def get_stats_fixed(_name, stat_type='PER_GAME', playoffs=False, career=False, ask_matches=True):
     """Fixed version of get_stats that handles the new table IDs on basketball-reference.com"""
-    name = lookup(_name, ask_matches)
-    suffix = get_player_suffix(name)
+    name = _lookup(_name, ask_matches)
+    suffix = _player_suffix(name)
     if not suffix:
         return pd.DataFrame()
     
     stat_type = stat_type.lower()
     table = None
     
-    # Map old table IDs to new ones
-    table_id_map = {
-        'per_game': 'per_game_stats',
-        'totals': 'totals_stats',
-        'per_minute': 'per_minute_stats',
-        'per_poss': 'per_poss_stats',
-        'advanced': 'advanced'
-    }
-    
-    # Add playoff prefix if needed
-    if playoffs:
-        table_id = f"{table_id_map.get(stat_type, stat_type)}_post"
-    else:
-        table_id = table_id_map.get(stat_type, stat_type)
+    table_id = _TABLE_IDS.get((stat_type, playoffs), f'{stat_type}_post' if playoffs else stat_type)
     
-    if stat_type in ['per_game', 'totals', 'advanced'] and not playoffs:
-        r = get_wrapper(f'https://www.basketball-reference.com/{suffix}')
-        if r.status_code == 200:
-            soup = BeautifulSoup(r.content, 'html.parser')
-            table = soup.find('table', {'id': table_id})
-            table = str(table)
-        else:
-            raise ConnectionError('Request to basketball reference failed')
-    elif stat_type in ['per_minute', 'per_poss'] or playoffs:
-        xpath = f"//table[@id='{table_id}']"
-        table = get_selenium_wrapper(f'https://www.basketball-reference.com/{suffix}', xpath)
+    url = f'https://www.basketball-reference.com/{suffix}'
+    table = _find_table(_player_page(url), table_id)
+
+    # Only render the page in a browser if the static HTML really doesn't carry the table
+    if table is None and (stat_type in ['per_minute', 'per_poss'] or playoffs):
+        html = get_selenium_wrapper(url, f"//table[@id='{table_id}']")
+        if html:
+            table = lxml.html.fromstring(html)
     
     if table is None:
         return pd.DataFrame()
     
-    df = pd.read_html(StringIO(table))[0]
-    df.rename(columns={'Season': 'SEASON', 'Age': 'AGE',
-                'Tm': 'TEAM', 'Lg': 'LEAGUE', 'Pos': 'POS', 'Awards': 'AWARDS'}, inplace=True)
-    if 'FG.1' in df.columns:
-        df.rename(columns={'FG.1': 'FG%'}, inplace=True)
-    if 'eFG' in df.columns:
-        df.rename(columns={'eFG': 'eFG%'}, inplace=True)
-    if 'FT.1' in df.columns:
-        df.rename(columns={'FT.1': 'FT%'}, inplace=True)
-
-    # Check if Career row exists
-    career_rows = df[df['SEASON']=='Career'].index
-    if len(career_rows) > 0:
-        career_index = career_rows[0]
-        if career:
-            df = df.iloc[career_index+2:, :]
-        else:
-            df = df.iloc[:career_index, :]
+    df = _table_to_frame(table, career)
+    df.rename(columns=_RENAME_MAP, inplace=True)
     
-    # Handle percentage columns
-    if len(df) > 0:
-        index = df.index[0]
-        for column in df.columns:
-            if pd.isna(df[column][index]):
-                df.rename(columns={column: f'{column.upper()}%'}, inplace=True)
+    # Handle percentage columns, never clobbering a column that already carries the % name
+    advanced = stat_type.endswith('_advanced') or stat_type == 'advanced'
+    df.columns = [n if n == c or n not in df.columns else c
+                  for c, n in ((c, _pct_name(c, advanced)) for c in df.columns)]
+
+    # Blank spacer columns between stat groups (advanced) carry no data, so drop them up front
+    spacers = [c for c in df.columns if c.startswith('Unnamed: ') and df[c].isna().all()]
+    if advanced:
+        spacers += ['G', 'MP']
+    df = df.loc[:, df.columns.difference(spacers, sort=False)]
 
-    if stat_type.endswith('_advanced') or stat_type == 'advanced':
-        df = df.drop(['G', 'MP'], axis=1)
+    # Counting columns fit in small ints, which keeps the memoized and pickled frames lean.
+    # Floats stay float64 so percentages don't pick up float32 noise in the JSON output
+    int_cols = df.select_dtypes('integer').columns
+    df[int_cols] = df[int_cols].apply(pd.to_numeric, downcast='integer')
 
     if not career:
         df = df.reset_index().drop('index', axis=1)
 
     return df
 
-# Monkey patch the original function
-players.get_stats = get_stats_fixed
\ No newline at end of file
+
+async def gather_stats(names, **kwargs):
+    """Fetch get_stats_fixed for several players concurrently, returned as {name: DataFrame}"""
+    loop = asyncio.get_running_loop()
+    frames = await asyncio.gather(*(
+        loop.run_in_executor(None, functools.partial(get_stats_fixed, name, **kwargs)) for name in names))
+    return dict(zip(names, frames))
+
+def stats_to_json(df):
+    """Serialize a stats DataFrame to a JSON array of row records, NaN cells become null"""
+    records = (df.reset_index(drop=True).astype(object)
+               .where(df.notna().to_numpy(), None).to_dict(orient='records'))
+    if orjson is not None:
+        return orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(records, default=lambda o: o.item() if isinstance(o, np.generic) else str(o))
+
+# Monkey patch the original functions
+request_utils.get_wrapper = _session_get
+utils.get_wrapper = _session_get
+players.get_wrapper = _session_get
+seasons.get_wrapper = _session_get
+players.get_stats = get_stats_fixed
+players.lookup = _lookup
+players.get_player_suffix = _player_suffix
\ No newline at end of file
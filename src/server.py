@@ -7,11 +7,14 @@ shooting stats, and more.
 """
 
 import asyncio
+import bisect
+import functools
 import logging
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
+import time
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any
+import numpy as np
 import pandas as pd
-from io import StringIO
 
 from fastmcp import FastMCP
 
@@ -27,9 +30,6 @@ except:
     pass
 
 from basketball_reference_scraper.players import get_stats as brs_get_stats, get_player_headshot
-from basketball_reference_scraper.utils import get_player_suffix
-from basketball_reference_scraper.lookup import lookup
-from basketball_reference_scraper.seasons import get_schedule
 
 # Try to import game logs and awards functions
 try:
@@ -44,6 +44,443 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Scraper results are reused for this long, keyed by (normalized name, stat type, playoffs).
+# Same setting as fix_basketball_reference.CACHE_TTL so the disk and page caches below expire with it
+STATS_CACHE_TTL = float(os.environ.get('NBA_STATS_CACHE_TTL', 6 * 60 * 60))
+# Oldest entries are evicted past this many tables
+STATS_CACHE_MAXSIZE = 512
+_stats_cache: Dict[tuple, tuple] = {}
+_stats_locks: Dict[tuple, asyncio.Lock] = {}
+
+# Stat columns coerced to numbers once when a table enters the cache, blank or odd cells become NaN
+NUMERIC_COLUMNS = frozenset([
+    'AGE', 'G', 'GS', 'MP', 'FG', 'FGA', 'FG%', '3P', '3PA', '3P%', '2P', '2PA', '2P%', 'eFG%',
+    'FT', 'FTA', 'FT%', 'ORB', 'DRB', 'TRB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PTS',
+    'PER', 'TS%', '3PAr', 'FTr', 'ORB%', 'DRB%', 'TRB%', 'AST%', 'STL%', 'BLK%', 'TOV%', 'USG%',
+    'OWS', 'DWS', 'WS', 'WS/48', 'OBPM', 'DBPM', 'BPM', 'VORP', 'ORtg', 'DRtg'
+])
+
+# Columns sent for each season in the season-by-season lists, the career rows keep every column
+_BOX_SCORE_COLUMNS = [
+    'SEASON', 'AGE', 'TEAM', 'Team', 'G', 'GS', 'MP', 'FG', 'FGA', 'FG%', '3P', '3PA', '3P%',
+    '2P', '2PA', '2P%', 'eFG%', 'FT', 'FTA', 'FT%', 'TRB', 'AST', 'STL', 'BLK', 'TOV', 'PTS'
+]
+SEASON_COLUMNS = {
+    "PER_GAME": _BOX_SCORE_COLUMNS,
+    "TOTALS": _BOX_SCORE_COLUMNS,
+    "PER_MINUTE": _BOX_SCORE_COLUMNS,
+    "PER_POSS": _BOX_SCORE_COLUMNS + ['ORtg', 'DRtg'],
+    "ADVANCED": [
+        'SEASON', 'AGE', 'TEAM', 'Team', 'PER', 'TS%', '3PAr', 'FTr', 'TRB%', 'AST%', 'STL%', 'BLK%',
+        'TOV%', 'USG%', 'OWS', 'DWS', 'WS', 'WS/48', 'OBPM', 'DBPM', 'BPM', 'VORP'
+    ],
+}
+
+# Stats looked up in the ADVANCED table instead of PER_GAME
+ADVANCED_STATS = frozenset(['PER', 'TS%', 'WS', 'BPM', 'VORP', 'USG%', 'ORtg', 'DRtg'])
+
+STAT_DESCRIPTIONS = {
+    "PTS": "Points per game",
+    "3P%": "Three-point percentage",
+    "AST": "Assists per game",
+    "TRB": "Total rebounds per game",
+    "PER": "Player Efficiency Rating",
+    "TS%": "True Shooting Percentage",
+    "WS": "Win Shares",
+    "BPM": "Box Plus/Minus",
+    "VORP": "Value Over Replacement Player"
+}
+
+# One pre-bound scraper call per legal (stat type, playoffs) pair
+STAT_TYPES = ("PER_GAME", "TOTALS", "PER_MINUTE", "PER_POSS", "ADVANCED")
+FETCHERS = {
+    (stat_type, playoffs): functools.partial(brs_get_stats, stat_type=stat_type, playoffs=playoffs, ask_matches=False)
+    for stat_type in STAT_TYPES
+    for playoffs in (False, True)
+}
+
+
+async def cached_get_stats(player_name: str, stat_type: str = "PER_GAME", playoffs: bool = False) -> pd.DataFrame:
+    """Fetch a stats table off the event loop, memoized with a TTL.
+
+    Concurrent requests for the same key wait on one fetch instead of each hitting the site.
+    """
+    key = (player_name.strip().lower(), stat_type.upper(), bool(playoffs))
+    fetcher = FETCHERS.get(key[1:])
+    if fetcher is None:
+        raise ValueError(f"Unknown stat type {stat_type!r}, expected one of {', '.join(STAT_TYPES)}")
+    async with _stats_locks.setdefault(key, asyncio.Lock()):
+        cached = _stats_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+            return cached[1].copy()
+        stats = prep_stats(await asyncio.to_thread(fetcher, player_name))
+        # An empty table is usually a failed or rate-limited scrape, retry it on the next call
+        if stats.empty:
+            return stats
+        # Re-insert so dict order stays oldest-first for eviction
+        _stats_cache.pop(key, None)
+        _stats_cache[key] = (time.monotonic(), stats)
+        while len(_stats_cache) > STATS_CACHE_MAXSIZE:
+            oldest = next(iter(_stats_cache))
+            del _stats_cache[oldest]
+            if not _stats_locks[oldest].locked():
+                del _stats_locks[oldest]
+        return stats.copy()
+
+
+@functools.lru_cache(maxsize=256)
+def season_label(season: int) -> str:
+    """Season label used by basketball-reference for the year a season ends, e.g. 2023 -> "2022-23"."""
+    return f"{season-1}-{season % 100:02d}"
+
+
+async def optional_stats(player_name: str, stat_type: str = "PER_GAME", playoffs: bool = False) -> pd.DataFrame:
+    """cached_get_stats for a secondary table, an empty frame when it can't be fetched."""
+    try:
+        return await cached_get_stats(player_name, stat_type=stat_type, playoffs=playoffs)
+    except Exception as e:
+        logger.warning("No %s table (playoffs=%s) for %s: %s", stat_type, playoffs, player_name, e)
+        return pd.DataFrame()
+
+
+def prep_stats(stats: pd.DataFrame) -> pd.DataFrame:
+    """Store SEASON as a categorical so season filters compare small integer codes.
+
+    Stat columns are made numeric, and when every season appears once the frame is also
+    indexed by SEASON for hash lookups.
+    """
+    for column in NUMERIC_COLUMNS.intersection(stats.columns):
+        if not pd.api.types.is_numeric_dtype(stats[column]):
+            stats[column] = pd.to_numeric(stats[column], errors='coerce')
+    if 'SEASON' in stats.columns:
+        stats['SEASON'] = stats['SEASON'].astype('category')
+        # Traded players repeat a season per team, those frames keep their positional index
+        if stats['SEASON'].is_unique:
+            stats.index = pd.CategoricalIndex(stats['SEASON'].array)
+    return stats
+
+
+def season_mask(stats: pd.DataFrame, season_str: str) -> np.ndarray:
+    """Boolean mask of the rows whose SEASON equals season_str."""
+    seasons = stats['SEASON']
+    if not isinstance(seasons.dtype, pd.CategoricalDtype):
+        return seasons.to_numpy() == season_str
+    if season_str not in seasons.cat.categories:
+        return np.zeros(len(stats), dtype=bool)
+    return seasons.cat.codes.to_numpy() == seasons.cat.categories.get_loc(season_str)
+
+
+def season_rows(stats: pd.DataFrame, season_str: str) -> pd.DataFrame:
+    """Rows of a stats table for a single season label."""
+    if isinstance(stats.index, pd.CategoricalIndex):
+        return stats.loc[[season_str]] if season_str in stats.index else stats.iloc[0:0]
+    return stats[season_mask(stats, season_str)]
+
+
+def split_career(stats: pd.DataFrame):
+    """Split a stats table into (career rows, season rows) with a single mask."""
+    if 'SEASON' not in stats.columns:
+        return stats.iloc[0:0], stats
+    # The scraper appends the Career row last, so usually no mask is needed
+    if len(stats) and stats['SEASON'].iat[-1] == 'Career':
+        return stats.iloc[-1:], stats.iloc[:-1]
+    is_career = season_mask(stats, 'Career')
+    return stats[is_career], stats[~is_career]
+
+
+def row_to_dict(df: pd.DataFrame) -> Dict[str, Any]:
+    """First row of a frame as a dict, or {} when the frame is empty."""
+    return df.iloc[0].to_dict() if len(df) else {}
+
+
+def row_value(df: pd.DataFrame, column: str, default: Any = 0) -> Any:
+    """Single cell from the first row of a frame, or default when the row or column is missing."""
+    if df.empty or column not in df.columns:
+        return default
+    return to_native(df.at[df.index[0], column])
+
+
+def to_native(value: Any) -> Any:
+    """numpy scalar as the matching Python scalar, the structured tool output can't carry numpy ints."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def season_records(season_data: pd.DataFrame, stat_type: str) -> List[Dict[str, Any]]:
+    """Season rows as records, trimmed to the columns worth sending for the stat type."""
+    columns = SEASON_COLUMNS.get(stat_type.upper())
+    if columns is not None:
+        season_data = season_data.loc[:, [c for c in columns if c in season_data.columns]]
+    # Same output as to_dict('records'), but converts whole columns to Python values at once
+    columns = list(season_data.columns)
+    values = [season_data.iloc[:, i].tolist() for i in range(len(columns))]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def stat_differences(first: Dict[str, Any], second: Dict[str, Any], stats: List[str]) -> Dict[str, float]:
+    """first - second for each stat both rows hold a number for, as one vectorized subtract."""
+    shared = [stat for stat in stats if stat in first and stat in second]
+    diff = (pd.to_numeric(pd.Series([first[stat] for stat in shared], index=shared, dtype=object), errors='coerce')
+            - pd.to_numeric(pd.Series([second[stat] for stat in shared], index=shared, dtype=object), errors='coerce'))
+    return diff.dropna().to_dict()
+
+
+def best_season_rows(season_data: pd.DataFrame, metrics: List[str]) -> Dict[str, Any]:
+    """Index label of the highest value for each metric, like idxmax but in one numpy pass.
+
+    Metrics that are missing or entirely blank are left out of the result.
+    """
+    metrics = [m for m in metrics if m in season_data.columns]
+    if season_data.empty or not metrics:
+        return {}
+    values = season_data[metrics].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    blank = np.isnan(values)
+    best = np.where(blank, -np.inf, values).argmax(axis=0)
+    return {m: season_data.index[i] for m, i, empty in zip(metrics, best, blank.all(axis=0)) if not empty}
+
+
+# Response key and column prefix for each shot type in the shooting splits
+SHOT_TYPES = (
+    ("field_goals", "FG"),
+    ("three_pointers", "3P"),
+    ("two_pointers", "2P"),
+    ("free_throws", "FT"),
+)
+
+
+def shooting_breakdown(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Made, attempted and percentage per shot type from a PER_GAME row dict."""
+    breakdown = {
+        key: {
+            "percentage": row.get(f'{prefix}%', 0),
+            "made_per_game": row.get(prefix, 0),
+            "attempted_per_game": row.get(f'{prefix}A', 0)
+        }
+        for key, prefix in SHOT_TYPES
+    }
+    breakdown["effective_fg_percentage"] = row.get('eFG%', 0)
+    return breakdown
+
+
+# Percentage metrics only count seasons with real volume behind them
+MIN_ATTEMPTS = {'3P%': ('3PA', 1.0)}
+
+
+def best_seasons(season_data: pd.DataFrame, metrics: List[str]) -> Dict[str, Any]:
+    """best_season_rows, with percentage metrics limited to seasons above MIN_ATTEMPTS."""
+    best = best_season_rows(season_data, [m for m in metrics if m not in MIN_ATTEMPTS])
+    for metric in metrics:
+        if metric in MIN_ATTEMPTS:
+            attempts, floor = MIN_ATTEMPTS[metric]
+            if attempts in season_data.columns:
+                best.update(best_season_rows(season_data[season_data[attempts] > floor], [metric]))
+    return best
+
+
+async def stat_query(
+    player_name: str,
+    stat_type: str,
+    season: Optional[int] = None,
+    best_metrics: List[str] = (),
+    label: str = "stats",
+    playoffs: bool = False
+) -> Dict[str, Any]:
+    """Fetch one stats table and reduce it the way the single-table tools report it.
+
+    With a season the result holds "season" and its "row"; otherwise "career", "season_data" and
+    "best", the full row of the best season for each of best_metrics. Misses come back as {"error": ...}.
+    """
+    stats = await cached_get_stats(player_name, stat_type=stat_type, playoffs=playoffs)
+    if stats.empty:
+        return {"error": f"No {label} found for {player_name}"}
+
+    if season:
+        season_str = season_label(season)
+        row = row_to_dict(season_rows(stats, season_str))
+        if not row:
+            return {"error": f"No {label} found for {player_name} in {season_str}"}
+        return {"season": season_str, "row": row}
+
+    career_row, season_data = split_career(stats)
+    return {
+        "career": row_to_dict(career_row),
+        "season_data": season_data,
+        "best": {metric: season_data.loc[idx].to_dict()
+                 for metric, idx in best_seasons(season_data, best_metrics).items()}
+    }
+
+
+# Common team abbreviations
+TEAM_NAMES = {
+    "GSW": "Golden State Warriors",
+    "LAL": "Los Angeles Lakers",
+    "BOS": "Boston Celtics",
+    "MIA": "Miami Heat",
+    "CHI": "Chicago Bulls",
+    "SAS": "San Antonio Spurs",
+    "PHI": "Philadelphia 76ers",
+    "CLE": "Cleveland Cavaliers",
+    "TOR": "Toronto Raptors",
+    "MIL": "Milwaukee Bucks"
+}
+
+# Full names of the common awards
+AWARD_NAMES = {
+    "MVP": "Most Valuable Player",
+    "DPOY": "Defensive Player of the Year",
+    "ROY": "Rookie of the Year",
+    "SMOY": "Sixth Man of the Year",
+    "MIP": "Most Improved Player"
+}
+
+# Single-season highs reported by the career highlights, by response key
+HIGHLIGHT_STATS = {
+    'PTS': 'points_per_game',
+    'TRB': 'rebounds_per_game',
+    'AST': 'assists_per_game',
+    'STL': 'steals_per_game',
+    'BLK': 'blocks_per_game',
+    'FG%': 'field_goal_percentage',
+    '3P%': 'three_point_percentage'
+}
+
+# Stats with estimated single-game highs, by response key
+GAME_HIGH_STATS = {
+    'PTS': 'points',
+    'TRB': 'rebounds',
+    'AST': 'assists',
+    'STL': 'steals',
+    'BLK': 'blocks',
+    '3P': 'three_pointers_made'
+}
+
+# Career milestone thresholds for each milestone_type
+MILESTONES = MappingProxyType({
+    category: MappingProxyType(info) for category, info in {
+        "points": {
+            "stat": "PTS",
+            "thresholds": (10000, 15000, 20000, 25000, 30000, 35000, 40000),
+            "per_game": "PTS",
+            "name": "career points"
+        },
+        "assists": {
+            "stat": "AST",
+            "thresholds": (5000, 6000, 7000, 8000, 9000, 10000, 12000, 15000),
+            "per_game": "AST",
+            "name": "career assists"
+        },
+        "rebounds": {
+            "stat": "TRB",
+            "thresholds": (5000, 7500, 10000, 12500, 15000, 17500, 20000),
+            "per_game": "TRB",
+            "name": "career rebounds"
+        },
+        "3pm": {
+            "stat": "3P",
+            "thresholds": (1000, 1500, 2000, 2500, 3000, 3500),
+            "per_game": "3P",
+            "name": "three-pointers made"
+        },
+        "games": {
+            "stat": "G",
+            "thresholds": (500, 750, 1000, 1250, 1500),
+            "per_game": None,
+            "name": "games played"
+        }
+    }.items()
+})
+
+# All-time thresholds for rough ranking estimates
+RANKING_THRESHOLDS = MappingProxyType({
+    category: MappingProxyType(info) for category, info in {
+        "points": {
+            "stat": "PTS",
+            "thresholds": (
+                (40000, 1), (38000, 2), (35000, 3), (33000, 4), (32000, 5),
+                (31000, 6), (30000, 8), (28000, 10), (27000, 12), (26000, 15),
+                (25000, 20), (23000, 25), (21000, 30), (20000, 35), (19000, 40),
+                (18000, 50), (15000, 75), (12000, 100), (10000, 150)
+            ),
+            "goat_value": 38387,  # Kareem
+            "goat_name": "Kareem Abdul-Jabbar (38,387)"
+        },
+        "assists": {
+            "stat": "AST",
+            "thresholds": (
+                (15000, 1), (12000, 2), (11000, 3), (10000, 4), (9000, 5),
+                (8000, 8), (7000, 12), (6000, 20), (5000, 35), (4000, 60)
+            ),
+            "goat_value": 15806,  # Stockton
+            "goat_name": "John Stockton (15,806)"
+        },
+        "rebounds": {
+            "stat": "TRB",
+            "thresholds": (
+                (23000, 1), (22000, 2), (21000, 3), (17000, 5), (16000, 8),
+                (15000, 12), (14000, 15), (13000, 20), (12000, 30), (10000, 50)
+            ),
+            "goat_value": 23924,  # Wilt
+            "goat_name": "Wilt Chamberlain (23,924)"
+        },
+        "3pm": {
+            "stat": "3P",
+            "thresholds": (
+                (3500, 1), (3000, 2), (2800, 3), (2600, 4), (2400, 5),
+                (2200, 8), (2000, 12), (1800, 20), (1500, 35), (1000, 100)
+            ),
+            "goat_value": 3747,  # Curry (as of 2024)
+            "goat_name": "Stephen Curry (3,700+)"
+        }
+    }.items()
+})
+
+# Ascending cutoffs and matching ranks per category, for bisecting a career total
+RANK_CUTOFFS = MappingProxyType({
+    category: (
+        tuple(threshold for threshold, _ in reversed(info["thresholds"])),
+        tuple(rank for _, rank in reversed(info["thresholds"]))
+    )
+    for category, info in RANKING_THRESHOLDS.items()
+})
+
+# Upper rank bound of each context blurb, the last blurb covers every rank past 50
+RANK_CONTEXT_BOUNDS = (5, 10, 25, 50)
+RANK_CONTEXTS = (
+    "All-time great in this category",
+    "Top 10 all-time - legendary status",
+    "Among the very best to ever play",
+    "Elite historical standing",
+    "Significant career achievement"
+)
+
+# Stats compared between a season's playoff run and its regular season
+PLAYOFF_COMPARISON_STATS = ("PTS", "TRB", "AST", "FG%", "3P%")
+
+# (PPG, FG%) multipliers applied to the baseline for each situational split, with its caveat
+SITUATIONAL_SPLITS = {
+    # Most players perform ~5-10% better at home
+    "home_away": (
+        {"home": (1.03, 1.02), "away": (0.97, 0.98)},
+        "Home/away splits are estimates based on typical NBA patterns"
+    ),
+    # Players typically perform better with rest
+    "rest_days": (
+        {"0_days_rest": (0.92, 0.95), "1_day_rest": (0.98, 0.99), "2+_days_rest": (1.05, 1.02)},
+        "Rest day impacts are estimates based on typical fatigue patterns"
+    ),
+    # Players typically have better stats in wins
+    "win_loss": (
+        {"wins": (1.1, 1.08), "losses": (0.9, 0.92)},
+        "Win/loss splits are estimates; better performance typically correlates with wins"
+    ),
+}
+
+# NBA season months
+NBA_SEASON_MONTHS = (
+    "October", "November", "December", "January",
+    "February", "March", "April"
+)
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     name="nba-player-stats",
@@ -96,65 +533,45 @@ async def get_player_career_stats(
         Complete career statistics including season-by-season breakdown
     """
     try:
-        # Get regular season stats
-        regular_stats = brs_get_stats(
-            player_name,
-            stat_type=stat_type,
-            playoffs=False,
-            ask_matches=False
-        )
-        
-        # Get playoff stats
-        playoff_stats = brs_get_stats(
-            player_name,
-            stat_type=stat_type,
-            playoffs=True,
-            ask_matches=False
+        # Get regular season and playoff stats concurrently
+        regular_stats, playoff_stats = await asyncio.gather(
+            cached_get_stats(player_name, stat_type=stat_type, playoffs=False),
+            optional_stats(player_name, stat_type=stat_type, playoffs=True)
         )
         
         if regular_stats.empty:
             return {"error": f"No stats found for {player_name}"}
         
         # Calculate career averages
-        career_row = regular_stats[regular_stats['SEASON'] == 'Career']
-        career_stats = career_row.to_dict('records')[0] if not career_row.empty else {}
+        career_row, season_data = split_career(regular_stats)
+        career_stats = row_to_dict(career_row)
         
         # Get best season based on PTS for per_game stats
-        if stat_type == "PER_GAME" and 'PTS' in regular_stats.columns:
-            season_data = regular_stats[regular_stats['SEASON'] != 'Career']
-            if not season_data.empty:
-                # Convert PTS to numeric, handling any non-numeric values
-                season_data['PTS'] = pd.to_numeric(season_data['PTS'], errors='coerce')
-                valid_pts = season_data.dropna(subset=['PTS'])
-                if not valid_pts.empty:
-                    best_season_idx = valid_pts['PTS'].idxmax()
-                    best_season = regular_stats.loc[best_season_idx].to_dict()
-                else:
-                    best_season = {}
-            else:
-                best_season = {}
-        else:
-            best_season = {}
+        best_season = {}
+        if stat_type == "PER_GAME":
+            best_season_idx = best_season_rows(season_data, ['PTS']).get('PTS')
+            if best_season_idx is not None:
+                best_season = regular_stats.loc[best_season_idx].to_dict()
         
         result = {
             "player_name": player_name,
             "stat_type": stat_type,
             "career_regular_season": career_stats,
-            "seasons": regular_stats[regular_stats['SEASON'] != 'Career'].to_dict('records'),
-            "total_seasons": len(regular_stats[regular_stats['SEASON'] != 'Career']),
+            "seasons": season_records(season_data, stat_type),
+            "total_seasons": len(season_data),
             "best_scoring_season": best_season if best_season else None
         }
         
         # Add playoff stats if available
         if not playoff_stats.empty:
-            playoff_career = playoff_stats[playoff_stats['SEASON'] == 'Career']
-            result["career_playoffs"] = playoff_career.to_dict('records')[0] if not playoff_career.empty else {}
-            result["playoff_seasons"] = playoff_stats[playoff_stats['SEASON'] != 'Career'].to_dict('records')
+            playoff_career, playoff_seasons = split_career(playoff_stats)
+            result["career_playoffs"] = row_to_dict(playoff_career)
+            result["playoff_seasons"] = season_records(playoff_seasons, stat_type)
         
         return result
         
     except Exception as e:
-        logger.error(f"Error getting career stats: {e}")
+        logger.error("Error getting career stats: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -177,20 +594,21 @@ async def get_player_season_stats(
         Detailed statistics for the specified season
     """
     try:
-        # Get regular season stats
-        regular_stats = brs_get_stats(
-            player_name,
-            stat_type=stat_type,
-            playoffs=False,
-            ask_matches=False
-        )
+        # Get regular season stats, fetching the playoff table alongside when requested
+        if include_playoffs:
+            regular_stats, playoff_stats = await asyncio.gather(
+                cached_get_stats(player_name, stat_type=stat_type, playoffs=False),
+                optional_stats(player_name, stat_type=stat_type, playoffs=True)
+            )
+        else:
+            regular_stats = await cached_get_stats(player_name, stat_type=stat_type, playoffs=False)
         
         if regular_stats.empty:
             return {"error": f"No stats found for {player_name}"}
         
         # Filter for specific season
-        season_str = f"{season-1}-{str(season)[2:]}"
-        season_stats = regular_stats[regular_stats['SEASON'] == season_str]
+        season_str = season_label(season)
+        season_stats = season_rows(regular_stats, season_str)
         
         if season_stats.empty:
             return {"error": f"No stats found for {player_name} in {season_str} season"}
@@ -199,27 +617,20 @@ async def get_player_season_stats(
             "player_name": player_name,
             "season": season_str,
             "stat_type": stat_type,
-            "regular_season": season_stats.to_dict('records')[0]
+            "regular_season": row_to_dict(season_stats)
         }
         
-        # Get playoff stats if requested
+        # Add playoff stats if requested
         if include_playoffs:
-            playoff_stats = brs_get_stats(
-                player_name,
-                stat_type=stat_type,
-                playoffs=True,
-                ask_matches=False
-            )
-            
             if not playoff_stats.empty:
-                playoff_season = playoff_stats[playoff_stats['SEASON'] == season_str]
+                playoff_season = season_rows(playoff_stats, season_str)
                 if not playoff_season.empty:
-                    result["playoffs"] = playoff_season.to_dict('records')[0]
+                    result["playoffs"] = row_to_dict(playoff_season)
         
         return result
         
     except Exception as e:
-        logger.error(f"Error getting season stats: {e}")
+        logger.error("Error getting season stats: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -238,55 +649,30 @@ async def get_player_advanced_stats(
         Advanced statistics including efficiency metrics
     """
     try:
-        # Get advanced stats
-        advanced_stats = brs_get_stats(
-            player_name,
-            stat_type="ADVANCED",
-            playoffs=False,
-            ask_matches=False
-        )
-        
-        if advanced_stats.empty:
-            return {"error": f"No advanced stats found for {player_name}"}
+        query = await stat_query(player_name, "ADVANCED", season, ['PER', 'TS%', 'WS', 'BPM', 'VORP'],
+                                 label="advanced stats")
+        if "error" in query:
+            return query
         
         if season:
-            season_str = f"{season-1}-{str(season)[2:]}"
-            advanced_stats = advanced_stats[advanced_stats['SEASON'] == season_str]
-            
-            if advanced_stats.empty:
-                return {"error": f"No advanced stats found for {player_name} in {season_str}"}
-            
             return {
                 "player_name": player_name,
-                "season": season_str,
-                "advanced_stats": advanced_stats.to_dict('records')[0]
+                "season": query["season"],
+                "advanced_stats": query["row"]
             }
         else:
-            # Get career totals
-            career_row = advanced_stats[advanced_stats['SEASON'] == 'Career']
-            
-            # Find best seasons by different metrics
-            season_data = advanced_stats[advanced_stats['SEASON'] != 'Career']
-            
-            best_seasons = {}
-            for metric in ['PER', 'TS%', 'WS', 'BPM', 'VORP']:
-                if metric in season_data.columns:
-                    best_idx = season_data[metric].idxmax()
-                    if pd.notna(best_idx):
-                        best_seasons[f"best_{metric}_season"] = {
-                            "season": season_data.loc[best_idx, 'SEASON'],
-                            "value": season_data.loc[best_idx, metric]
-                        }
-            
             return {
                 "player_name": player_name,
-                "career_advanced": career_row.to_dict('records')[0] if not career_row.empty else {},
-                "seasons": season_data.to_dict('records'),
-                "best_seasons": best_seasons
+                "career_advanced": query["career"],
+                "seasons": season_records(query["season_data"], "ADVANCED"),
+                "best_seasons": {
+                    f"best_{metric}_season": {"season": row['SEASON'], "value": row[metric]}
+                    for metric, row in query["best"].items()
+                }
             }
         
     except Exception as e:
-        logger.error(f"Error getting advanced stats: {e}")
+        logger.error("Error getting advanced stats: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -305,41 +691,25 @@ async def get_player_per36_stats(
         Per-36-minute statistics (pace-adjusted)
     """
     try:
-        # Get per minute stats
-        per_min_stats = brs_get_stats(
-            player_name,
-            stat_type="PER_MINUTE",
-            playoffs=False,
-            ask_matches=False
-        )
-        
-        if per_min_stats.empty:
-            return {"error": f"No per-36 stats found for {player_name}"}
+        query = await stat_query(player_name, "PER_MINUTE", season, label="per-36 stats")
+        if "error" in query:
+            return query
         
         if season:
-            season_str = f"{season-1}-{str(season)[2:]}"
-            season_stats = per_min_stats[per_min_stats['SEASON'] == season_str]
-            
-            if season_stats.empty:
-                return {"error": f"No per-36 stats found for {player_name} in {season_str}"}
-            
             return {
                 "player_name": player_name,
-                "season": season_str,
-                "per_36_stats": season_stats.to_dict('records')[0]
+                "season": query["season"],
+                "per_36_stats": query["row"]
             }
         else:
-            # Career averages
-            career_row = per_min_stats[per_min_stats['SEASON'] == 'Career']
-            
             return {
                 "player_name": player_name,
-                "career_per_36": career_row.to_dict('records')[0] if not career_row.empty else {},
-                "seasons": per_min_stats[per_min_stats['SEASON'] != 'Career'].to_dict('records')
+                "career_per_36": query["career"],
+                "seasons": season_records(query["season_data"], "PER_MINUTE")
             }
         
     except Exception as e:
-        logger.error(f"Error getting per-36 stats: {e}")
+        logger.error("Error getting per-36 stats: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -362,28 +732,19 @@ async def compare_players(
         Side-by-side comparison of the two players
     """
     try:
-        # Get stats for both players
-        player1_stats = brs_get_stats(
-            player1_name,
-            stat_type=stat_type,
-            playoffs=False,
-            ask_matches=False
-        )
-        
-        player2_stats = brs_get_stats(
-            player2_name,
-            stat_type=stat_type,
-            playoffs=False,
-            ask_matches=False
+        # Get stats for both players concurrently
+        player1_stats, player2_stats = await asyncio.gather(
+            cached_get_stats(player1_name, stat_type=stat_type, playoffs=False),
+            cached_get_stats(player2_name, stat_type=stat_type, playoffs=False)
         )
         
         if player1_stats.empty or player2_stats.empty:
             return {"error": "Could not find stats for one or both players"}
         
         if season:
-            season_str = f"{season-1}-{str(season)[2:]}"
-            p1_season = player1_stats[player1_stats['SEASON'] == season_str]
-            p2_season = player2_stats[player2_stats['SEASON'] == season_str]
+            season_str = season_label(season)
+            p1_season = season_rows(player1_stats, season_str)
+            p2_season = season_rows(player2_stats, season_str)
             
             if p1_season.empty or p2_season.empty:
                 return {"error": f"One or both players didn't play in {season_str}"}
@@ -393,53 +754,49 @@ async def compare_players(
                 "stat_type": stat_type,
                 "player1": {
                     "name": player1_name,
-                    "stats": p1_season.to_dict('records')[0]
+                    "stats": row_to_dict(p1_season)
                 },
                 "player2": {
                     "name": player2_name,
-                    "stats": p2_season.to_dict('records')[0]
+                    "stats": row_to_dict(p2_season)
                 }
             }
         else:
             # Career comparison
-            p1_career = player1_stats[player1_stats['SEASON'] == 'Career']
-            p2_career = player2_stats[player2_stats['SEASON'] == 'Career']
+            p1_career, p1_seasons = split_career(player1_stats)
+            p2_career, p2_seasons = split_career(player2_stats)
+            p1_dict = row_to_dict(p1_career)
+            p2_dict = row_to_dict(p2_career)
             
             # Calculate some key differences for per_game stats
             comparison = {}
-            if stat_type == "PER_GAME" and not p1_career.empty and not p2_career.empty:
-                p1_dict = p1_career.to_dict('records')[0]
-                p2_dict = p2_career.to_dict('records')[0]
-                
-                for stat in ['PTS', 'AST', 'TRB', 'STL', 'BLK', 'FG%', 'FT%', '3P%']:
-                    if stat in p1_dict and stat in p2_dict:
-                        try:
-                            comparison[stat] = {
-                                player1_name: p1_dict[stat],
-                                player2_name: p2_dict[stat],
-                                "difference": float(p1_dict[stat]) - float(p2_dict[stat])
-                            }
-                        except:
-                            pass
+            if stat_type == "PER_GAME" and p1_dict and p2_dict:
+                stats = ['PTS', 'AST', 'TRB', 'STL', 'BLK', 'FG%', 'FT%', '3P%']
+                for stat, difference in stat_differences(p1_dict, p2_dict, stats).items():
+                    comparison[stat] = {
+                        player1_name: p1_dict[stat],
+                        player2_name: p2_dict[stat],
+                        "difference": difference
+                    }
             
             return {
                 "comparison_type": "career",
                 "stat_type": stat_type,
                 "player1": {
                     "name": player1_name,
-                    "career_stats": p1_career.to_dict('records')[0] if not p1_career.empty else {},
-                    "total_seasons": len(player1_stats[player1_stats['SEASON'] != 'Career'])
+                    "career_stats": p1_dict,
+                    "total_seasons": len(p1_seasons)
                 },
                 "player2": {
                     "name": player2_name,
-                    "career_stats": p2_career.to_dict('records')[0] if not p2_career.empty else {},
-                    "total_seasons": len(player2_stats[player2_stats['SEASON'] != 'Career'])
+                    "career_stats": p2_dict,
+                    "total_seasons": len(p2_seasons)
                 },
                 "statistical_comparison": comparison
             }
         
     except Exception as e:
-        logger.error(f"Error comparing players: {e}")
+        logger.error("Error comparing players: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -458,114 +815,47 @@ async def get_player_shooting_splits(
         Detailed shooting percentages and volume stats
     """
     try:
-        # Get per game stats which include shooting percentages
-        stats = brs_get_stats(
-            player_name,
-            stat_type="PER_GAME",
-            playoffs=False,
-            ask_matches=False
-        )
-        
-        if stats.empty:
-            return {"error": f"No stats found for {player_name}"}
+        # Per game stats include the shooting percentages
+        query = await stat_query(player_name, "PER_GAME", season, ['FG%', '3P%', 'FT%'])
+        if "error" in query:
+            return query
         
         if season:
-            season_str = f"{season-1}-{str(season)[2:]}"
-            season_stats = stats[stats['SEASON'] == season_str]
-            
-            if season_stats.empty:
-                return {"error": f"No stats found for {player_name} in {season_str}"}
-            
-            row = season_stats.iloc[0]
+            row = query["row"]
             
             return {
                 "player_name": player_name,
-                "season": season_str,
+                "season": query["season"],
                 "shooting_stats": {
-                    "field_goals": {
-                        "percentage": row.get('FG%', 0),
-                        "made_per_game": row.get('FG', 0),
-                        "attempted_per_game": row.get('FGA', 0)
-                    },
-                    "three_pointers": {
-                        "percentage": row.get('3P%', 0),
-                        "made_per_game": row.get('3P', 0),
-                        "attempted_per_game": row.get('3PA', 0)
-                    },
-                    "two_pointers": {
-                        "percentage": row.get('2P%', 0),
-                        "made_per_game": row.get('2P', 0),
-                        "attempted_per_game": row.get('2PA', 0)
-                    },
-                    "free_throws": {
-                        "percentage": row.get('FT%', 0),
-                        "made_per_game": row.get('FT', 0),
-                        "attempted_per_game": row.get('FTA', 0)
-                    },
-                    "effective_fg_percentage": row.get('eFG%', 0),
+                    **shooting_breakdown(row),
                     "true_shooting_percentage": row.get('TS%', 0) if 'TS%' in row else None
                 }
             }
         else:
             # Career shooting stats
-            career_row = stats[stats['SEASON'] == 'Career']
-            
-            if career_row.empty:
+            row = query["career"]
+            if not row:
                 return {"error": "No career stats found"}
             
-            row = career_row.iloc[0]
-            
-            # Find best shooting seasons
-            season_data = stats[stats['SEASON'] != 'Career']
-            best_seasons = {}
-            
+            # Best shooting seasons
+            best_shooting = {}
             for stat, name in [('FG%', 'field_goal'), ('3P%', 'three_point'), ('FT%', 'free_throw')]:
-                if stat in season_data.columns:
-                    # Filter out seasons with very few attempts
-                    if stat == '3P%':
-                        filtered = season_data[season_data['3PA'] > 1.0]
-                    else:
-                        filtered = season_data
-                    
-                    if not filtered.empty:
-                        best_idx = filtered[stat].idxmax()
-                        if pd.notna(best_idx):
-                            best_seasons[f"best_{name}_season"] = {
-                                "season": filtered.loc[best_idx, 'SEASON'],
-                                "percentage": filtered.loc[best_idx, stat],
-                                "attempts_per_game": filtered.loc[best_idx, stat.replace('%', 'A')]
-                            }
+                if stat in query["best"]:
+                    best = query["best"][stat]
+                    best_shooting[f"best_{name}_season"] = {
+                        "season": best['SEASON'],
+                        "percentage": best[stat],
+                        "attempts_per_game": best[stat.replace('%', 'A')]
+                    }
             
             return {
                 "player_name": player_name,
-                "career_shooting": {
-                    "field_goals": {
-                        "percentage": row.get('FG%', 0),
-                        "made_per_game": row.get('FG', 0),
-                        "attempted_per_game": row.get('FGA', 0)
-                    },
-                    "three_pointers": {
-                        "percentage": row.get('3P%', 0),
-                        "made_per_game": row.get('3P', 0),
-                        "attempted_per_game": row.get('3PA', 0)
-                    },
-                    "two_pointers": {
-                        "percentage": row.get('2P%', 0),
-                        "made_per_game": row.get('2P', 0),
-                        "attempted_per_game": row.get('2PA', 0)
-                    },
-                    "free_throws": {
-                        "percentage": row.get('FT%', 0),
-                        "made_per_game": row.get('FT', 0),
-                        "attempted_per_game": row.get('FTA', 0)
-                    },
-                    "effective_fg_percentage": row.get('eFG%', 0)
-                },
-                "best_shooting_seasons": best_seasons
+                "career_shooting": shooting_breakdown(row),
+                "best_shooting_seasons": best_shooting
             }
         
     except Exception as e:
-        logger.error(f"Error getting shooting splits: {e}")
+        logger.error("Error getting shooting splits: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -584,60 +874,39 @@ async def get_player_totals(
         Total statistics including points, rebounds, assists, etc.
     """
     try:
-        # Get totals stats
-        totals = brs_get_stats(
-            player_name,
-            stat_type="TOTALS",
-            playoffs=False,
-            ask_matches=False
-        )
-        
-        if totals.empty:
-            return {"error": f"No stats found for {player_name}"}
+        query = await stat_query(player_name, "TOTALS", season, ['PTS'])
+        if "error" in query:
+            return query
         
         if season:
-            season_str = f"{season-1}-{str(season)[2:]}"
-            season_totals = totals[totals['SEASON'] == season_str]
-            
-            if season_totals.empty:
-                return {"error": f"No stats found for {player_name} in {season_str}"}
-            
             return {
                 "player_name": player_name,
-                "season": season_str,
-                "totals": season_totals.to_dict('records')[0]
+                "season": query["season"],
+                "totals": query["row"]
             }
         else:
-            # Career totals
-            career_row = totals[totals['SEASON'] == 'Career']
-            
-            # Find milestone seasons
-            season_data = totals[totals['SEASON'] != 'Career']
+            season_data = query["season_data"]
             milestones = {}
             
             # First 1000+ point season
-            thousand_pt_seasons = season_data[season_data['PTS'] >= 1000]
+            thousand_pt_seasons = season_data['SEASON'][season_data['PTS'] >= 1000]
             if not thousand_pt_seasons.empty:
-                milestones['first_1000_point_season'] = thousand_pt_seasons.iloc[0]['SEASON']
+                milestones['first_1000_point_season'] = thousand_pt_seasons.iat[0]
             
             # Highest scoring season
-            if 'PTS' in season_data.columns:
-                best_idx = season_data['PTS'].idxmax()
-                if pd.notna(best_idx):
-                    milestones['highest_scoring_season'] = {
-                        "season": season_data.loc[best_idx, 'SEASON'],
-                        "points": season_data.loc[best_idx, 'PTS']
-                    }
+            if 'PTS' in query["best"]:
+                best = query["best"]['PTS']
+                milestones['highest_scoring_season'] = {"season": best['SEASON'], "points": best['PTS']}
             
             return {
                 "player_name": player_name,
-                "career_totals": career_row.to_dict('records')[0] if not career_row.empty else {},
-                "seasons": season_data.to_dict('records'),
+                "career_totals": query["career"],
+                "seasons": season_records(season_data, "TOTALS"),
                 "milestones": milestones
             }
         
     except Exception as e:
-        logger.error(f"Error getting totals: {e}")
+        logger.error("Error getting totals: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -656,12 +925,10 @@ async def get_player_playoff_stats(
         Complete playoff statistics including season-by-season breakdown
     """
     try:
-        # Get playoff stats
-        playoff_stats = brs_get_stats(
-            player_name,
-            stat_type=stat_type,
-            playoffs=True,
-            ask_matches=False
+        # Get playoff stats, with the regular season alongside for comparison
+        playoff_stats, regular_stats = await asyncio.gather(
+            cached_get_stats(player_name, stat_type=stat_type, playoffs=True),
+            optional_stats(player_name, stat_type=stat_type, playoffs=False)
         )
         
         if playoff_stats.empty:
@@ -672,45 +939,35 @@ async def get_player_playoff_stats(
             }
         
         # Get career playoff totals
-        career_row = playoff_stats[playoff_stats['SEASON'] == 'Career']
-        career_stats = career_row.to_dict('records')[0] if not career_row.empty else {}
-        
-        # Get regular season for comparison
-        regular_stats = brs_get_stats(
-            player_name,
-            stat_type=stat_type,
-            playoffs=False,
-            ask_matches=False
-        )
+        career_row, playoff_seasons = split_career(playoff_stats)
+        career_stats = row_to_dict(career_row)
         
-        regular_career = regular_stats[regular_stats['SEASON'] == 'Career']
-        regular_career_stats = regular_career.to_dict('records')[0] if not regular_career.empty else {}
+        # Regular season career for comparison
+        regular_career, _ = split_career(regular_stats)
+        regular_career_stats = row_to_dict(regular_career)
         
         # Compare key stats if PER_GAME
         comparison = {}
         if stat_type == "PER_GAME" and career_stats and regular_career_stats:
-            for stat in ['PTS', 'AST', 'TRB', 'FG%', '3P%', 'FT%']:
-                if stat in career_stats and stat in regular_career_stats:
-                    try:
-                        comparison[stat] = {
-                            "playoffs": float(career_stats[stat]),
-                            "regular_season": float(regular_career_stats[stat]),
-                            "difference": float(career_stats[stat]) - float(regular_career_stats[stat])
-                        }
-                    except:
-                        pass
+            stats = ['PTS', 'AST', 'TRB', 'FG%', '3P%', 'FT%']
+            for stat, difference in stat_differences(career_stats, regular_career_stats, stats).items():
+                comparison[stat] = {
+                    "playoffs": career_stats[stat],
+                    "regular_season": regular_career_stats[stat],
+                    "difference": difference
+                }
         
         return {
             "player_name": player_name,
             "stat_type": stat_type,
             "career_playoff_stats": career_stats,
-            "playoff_appearances": len(playoff_stats[playoff_stats['SEASON'] != 'Career']),
-            "playoff_seasons": playoff_stats[playoff_stats['SEASON'] != 'Career'].to_dict('records'),
+            "playoff_appearances": len(playoff_seasons),
+            "playoff_seasons": season_records(playoff_seasons, stat_type),
             "playoff_vs_regular_season": comparison
         }
         
     except Exception as e:
-        logger.error(f"Error getting playoff stats: {e}")
+        logger.error("Error getting playoff stats: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -725,7 +982,7 @@ async def get_player_headshot_url(player_name: str) -> Dict[str, Any]:
         URL to the player's headshot image
     """
     try:
-        url = get_player_headshot(player_name)
+        url = await asyncio.to_thread(get_player_headshot, player_name)
         
         return {
             "player_name": player_name,
@@ -733,7 +990,7 @@ async def get_player_headshot_url(player_name: str) -> Dict[str, Any]:
             "source": "basketball-reference.com"
         }
     except Exception as e:
-        logger.error(f"Error getting player headshot: {e}")
+        logger.error("Error getting player headshot: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -760,17 +1017,20 @@ async def get_player_game_log(
     try:
         # For now, we'll provide aggregate stats for the season
         # In a full implementation, this would fetch individual game logs
-        season_stats = await get_player_season_stats(player_name, season, "PER_GAME", include_playoffs=False)
+        queries = [stat_query(player_name, "PER_GAME", season)]
+        if playoffs:
+            queries.append(stat_query(player_name, "PER_GAME", season, playoffs=True))
+        regular, *playoff = await asyncio.gather(*queries)
         
-        if "error" in season_stats:
-            return season_stats
+        if "error" in regular:
+            return regular
         
         # Extract key stats to simulate game log summary
-        reg_season = season_stats.get("regular_season", {})
+        reg_season = regular["row"]
         
         result = {
             "player_name": player_name,
-            "season": f"{season-1}-{str(season)[2:]}",
+            "season": regular["season"],
             "type": "playoffs" if playoffs else "regular_season",
             "summary": {
                 "games_played": reg_season.get("G", 0),
@@ -783,8 +1043,8 @@ async def get_player_game_log(
             "note": "Individual game logs would require additional implementation"
         }
         
-        if playoffs and "playoffs" in season_stats:
-            playoff_data = season_stats["playoffs"]
+        if playoff and "row" in playoff[0]:
+            playoff_data = playoff[0]["row"]
             result["playoff_summary"] = {
                 "games_played": playoff_data.get("G", 0),
                 "average_points": playoff_data.get("PTS", 0),
@@ -795,7 +1055,7 @@ async def get_player_game_log(
         return result
         
     except Exception as e:
-        logger.error(f"Error getting game log: {e}")
+        logger.error("Error getting game log: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -817,25 +1077,17 @@ async def get_player_specific_stat(
     """
     try:
         # Determine which stat type to use based on the requested stat
-        if stat_name in ['PER', 'TS%', 'WS', 'BPM', 'VORP', 'USG%', 'ORtg', 'DRtg']:
-            stat_type = "ADVANCED"
-        else:
-            stat_type = "PER_GAME"
+        stat_type = "ADVANCED" if stat_name in ADVANCED_STATS else "PER_GAME"
         
         # Get the stats
-        stats = brs_get_stats(
-            player_name,
-            stat_type=stat_type,
-            playoffs=False,
-            ask_matches=False
-        )
+        stats = await cached_get_stats(player_name, stat_type=stat_type, playoffs=False)
         
         if stats.empty:
             return {"error": f"No stats found for {player_name}"}
         
         # Filter for specific season
-        season_str = f"{season-1}-{str(season)[2:]}"
-        season_stats = stats[stats['SEASON'] == season_str]
+        season_str = season_label(season)
+        season_stats = season_rows(stats, season_str)
         
         if season_stats.empty:
             return {"error": f"No stats found for {player_name} in {season_str} season"}
@@ -844,11 +1096,13 @@ async def get_player_specific_stat(
         if stat_name not in season_stats.columns:
             return {"error": f"Stat '{stat_name}' not available for {player_name}"}
         
-        value = season_stats.iloc[0][stat_name]
+        # Only the requested column is converted to dicts
+        season_row = row_to_dict(season_stats[[stat_name]])
+        value = season_row[stat_name]
         
         # Get context by finding career average
-        career_row = stats[stats['SEASON'] == 'Career']
-        career_value = career_row.iloc[0][stat_name] if not career_row.empty and stat_name in career_row.columns else None
+        career_row = row_to_dict(split_career(stats)[0][[stat_name]])
+        career_value = career_row.get(stat_name)
         
         result = {
             "player_name": player_name,
@@ -860,31 +1114,18 @@ async def get_player_specific_stat(
         
         if career_value is not None:
             result["career_average"] = career_value
-            try:
-                result["vs_career"] = float(value) - float(career_value)
-            except:
-                pass
+            difference = stat_differences(season_row, career_row, [stat_name])
+            if stat_name in difference:
+                result["vs_career"] = difference[stat_name]
         
         # Add context about what the stat means
-        stat_descriptions = {
-            "PTS": "Points per game",
-            "3P%": "Three-point percentage",
-            "AST": "Assists per game",
-            "TRB": "Total rebounds per game",
-            "PER": "Player Efficiency Rating",
-            "TS%": "True Shooting Percentage",
-            "WS": "Win Shares",
-            "BPM": "Box Plus/Minus",
-            "VORP": "Value Over Replacement Player"
-        }
-        
-        if stat_name in stat_descriptions:
-            result["description"] = stat_descriptions[stat_name]
+        if stat_name in STAT_DESCRIPTIONS:
+            result["description"] = STAT_DESCRIPTIONS[stat_name]
         
         return result
         
     except Exception as e:
-        logger.error(f"Error getting specific stat: {e}")
+        logger.error("Error getting specific stat: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -914,21 +1155,7 @@ async def get_player_vs_team_stats(
         if "error" in career_stats:
             return career_stats
         
-        # Common team abbreviations
-        team_names = {
-            "GSW": "Golden State Warriors",
-            "LAL": "Los Angeles Lakers",
-            "BOS": "Boston Celtics",
-            "MIA": "Miami Heat",
-            "CHI": "Chicago Bulls",
-            "SAS": "San Antonio Spurs",
-            "PHI": "Philadelphia 76ers",
-            "CLE": "Cleveland Cavaliers",
-            "TOR": "Toronto Raptors",
-            "MIL": "Milwaukee Bucks"
-        }
-        
-        team_name = team_names.get(team_abbreviation, team_abbreviation)
+        team_name = TEAM_NAMES.get(team_abbreviation, team_abbreviation)
         
         return {
             "player_name": player_name,
@@ -940,7 +1167,7 @@ async def get_player_vs_team_stats(
         }
         
     except Exception as e:
-        logger.error(f"Error getting vs team stats: {e}")
+        logger.error("Error getting vs team stats: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -974,17 +1201,8 @@ async def get_player_awards_voting(
             "note": "Award voting data would require additional implementation"
         }
         
-        # Map common awards
-        award_names = {
-            "MVP": "Most Valuable Player",
-            "DPOY": "Defensive Player of the Year",
-            "ROY": "Rookie of the Year",
-            "SMOY": "Sixth Man of the Year",
-            "MIP": "Most Improved Player"
-        }
-        
-        if award_type in award_names:
-            result["award_full_name"] = award_names[award_type]
+        if award_type in AWARD_NAMES:
+            result["award_full_name"] = AWARD_NAMES[award_type]
         
         # Add career context
         result["career_context"] = {
@@ -995,7 +1213,7 @@ async def get_player_awards_voting(
         return result
         
     except Exception as e:
-        logger.error(f"Error getting awards voting: {e}")
+        logger.error("Error getting awards voting: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1024,7 +1242,7 @@ async def get_player_monthly_splits(
         
         result = {
             "player_name": player_name,
-            "season": f"{season-1}-{str(season)[2:]}",
+            "season": season_label(season),
             "season_averages": season_stats.get("regular_season", {}),
             "note": "Monthly splits would require game log analysis"
         }
@@ -1032,16 +1250,12 @@ async def get_player_monthly_splits(
         if month:
             result["requested_month"] = month
         
-        # NBA season months
-        result["nba_season_months"] = [
-            "October", "November", "December", "January",
-            "February", "March", "April"
-        ]
+        result["nba_season_months"] = list(NBA_SEASON_MONTHS)
         
         return result
         
     except Exception as e:
-        logger.error(f"Error getting monthly splits: {e}")
+        logger.error("Error getting monthly splits: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1063,7 +1277,7 @@ async def get_player_clutch_stats(
         # Get regular stats for comparison
         if season:
             stats = await get_player_season_stats(player_name, season, "PER_GAME")
-            season_str = f"{season-1}-{str(season)[2:]}"
+            season_str = season_label(season)
         else:
             stats = await get_player_career_stats(player_name, "PER_GAME")
             season_str = "Career"
@@ -1093,7 +1307,7 @@ async def get_player_clutch_stats(
         return result
         
     except Exception as e:
-        logger.error(f"Error getting clutch stats: {e}")
+        logger.error("Error getting clutch stats: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1123,7 +1337,7 @@ async def get_player_playoffs_by_year(
         if "error" in season_stats:
             return season_stats
         
-        season_str = f"{season-1}-{str(season)[2:]}"
+        season_str = season_label(season)
         
         result = {
             "player_name": player_name,
@@ -1137,23 +1351,19 @@ async def get_player_playoffs_by_year(
             playoff = season_stats["playoffs"]
             
             comparison = {}
-            for stat in ["PTS", "TRB", "AST", "FG%", "3P%"]:
-                if stat in reg and stat in playoff:
-                    try:
-                        comparison[stat] = {
-                            "regular_season": reg[stat],
-                            "playoffs": playoff[stat],
-                            "difference": float(playoff[stat]) - float(reg[stat])
-                        }
-                    except:
-                        pass
+            for stat, difference in stat_differences(playoff, reg, PLAYOFF_COMPARISON_STATS).items():
+                comparison[stat] = {
+                    "regular_season": reg[stat],
+                    "playoffs": playoff[stat],
+                    "difference": difference
+                }
             
             result["playoff_vs_regular"] = comparison
         
         return result
         
     except Exception as e:
-        logger.error(f"Error getting playoff year stats: {e}")
+        logger.error("Error getting playoff year stats: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1168,28 +1378,28 @@ async def get_player_career_highlights(player_name: str) -> Dict[str, Any]:
         Career highlights including best seasons, records, and achievements
     """
     try:
-        # Get various stat types to compile highlights
-        per_game = brs_get_stats(player_name, stat_type="PER_GAME", playoffs=False, ask_matches=False)
-        totals = brs_get_stats(player_name, stat_type="TOTALS", playoffs=False, ask_matches=False)
-        advanced = brs_get_stats(player_name, stat_type="ADVANCED", playoffs=False, ask_matches=False)
+        # All three tables come from the same player page, which the scraper downloads once
+        per_game, totals, advanced = await asyncio.gather(
+            cached_get_stats(player_name, stat_type="PER_GAME", playoffs=False),
+            cached_get_stats(player_name, stat_type="TOTALS", playoffs=False),
+            cached_get_stats(player_name, stat_type="ADVANCED", playoffs=False)
+        )
         
         if per_game.empty:
             return {"error": f"No stats found for {player_name}"}
         
         # Get career stats
-        career_pg = per_game[per_game['SEASON'] == 'Career'].to_dict('records')[0] if not per_game[per_game['SEASON'] == 'Career'].empty else {}
-        career_totals = totals[totals['SEASON'] == 'Career'].to_dict('records')[0] if not totals[totals['SEASON'] == 'Career'].empty else {}
-        
-        # Season data
-        season_pg = per_game[per_game['SEASON'] != 'Career']
-        season_totals = totals[totals['SEASON'] != 'Career']
-        season_advanced = advanced[advanced['SEASON'] != 'Career']
+        career_pg_row, season_pg = split_career(per_game)
+        career_totals_row, season_totals = split_career(totals)
+        _, season_advanced = split_career(advanced)
+        career_pg = row_to_dict(career_pg_row)
+        career_totals = row_to_dict(career_totals_row)
         
         highlights = {
             "player_name": player_name,
             "career_overview": {
                 "seasons_played": len(season_pg),
-                "games_played": career_totals.get('G', 0),
+                "games_played": career_pg.get('G', 0),
                 "career_ppg": career_pg.get('PTS', 0),
                 "career_rpg": career_pg.get('TRB', 0),
                 "career_apg": career_pg.get('AST', 0),
@@ -1199,54 +1409,38 @@ async def get_player_career_highlights(player_name: str) -> Dict[str, Any]:
         }
         
         # Find single season highs
-        stats_to_check = {
-            'PTS': 'points_per_game',
-            'TRB': 'rebounds_per_game',
-            'AST': 'assists_per_game',
-            'STL': 'steals_per_game',
-            'BLK': 'blocks_per_game',
-            'FG%': 'field_goal_percentage',
-            '3P%': 'three_point_percentage'
-        }
-        
-        for stat, name in stats_to_check.items():
-            if stat in season_pg.columns:
-                # For percentages, filter out seasons with low attempts
-                if stat == '3P%':
-                    filtered = season_pg[season_pg['3PA'] > 1.0]
-                else:
-                    filtered = season_pg
-                
-                if not filtered.empty and filtered[stat].notna().any():
-                    best_idx = filtered[stat].idxmax()
-                    if pd.notna(best_idx):
-                        highlights["single_season_highs"][name] = {
-                            "value": filtered.loc[best_idx, stat],
-                            "season": filtered.loc[best_idx, 'SEASON']
-                        }
+        best_rows = best_seasons(season_pg, list(HIGHLIGHT_STATS))
+        
+        for stat, name in HIGHLIGHT_STATS.items():
+            if stat in best_rows:
+                best_idx = best_rows[stat]
+                highlights["single_season_highs"][name] = {
+                    "value": to_native(season_pg.at[best_idx, stat]),
+                    "season": season_pg.at[best_idx, 'SEASON']
+                }
         
         # Find 20+ PPG seasons
         twenty_ppg_seasons = season_pg[season_pg['PTS'] >= 20.0]
         highlights["seasons_20plus_ppg"] = len(twenty_ppg_seasons)
         
-        # Find All-Star appearances (if AWARDS column exists)
+        # Find All-Star appearances (if AWARDS column exists), it parses as all-blank floats
+        # for players who never won anything, so match on it as strings
         if 'AWARDS' in season_pg.columns:
-            all_star_seasons = season_pg[season_pg['AWARDS'].notna() & season_pg['AWARDS'].str.contains('AS', na=False)]
-            highlights["all_star_appearances"] = len(all_star_seasons)
+            awards = season_pg['AWARDS'].astype('string')
+            highlights["all_star_appearances"] = int(awards.str.contains('AS', na=False, regex=False).sum())
         
         # Best advanced stat season
-        if not season_advanced.empty and 'PER' in season_advanced.columns:
-            best_per_idx = season_advanced['PER'].idxmax()
-            if pd.notna(best_per_idx):
-                highlights["best_per_season"] = {
-                    "value": season_advanced.loc[best_per_idx, 'PER'],
-                    "season": season_advanced.loc[best_per_idx, 'SEASON']
-                }
+        best_per_idx = best_season_rows(season_advanced, ['PER']).get('PER')
+        if best_per_idx is not None:
+            highlights["best_per_season"] = {
+                "value": to_native(season_advanced.at[best_per_idx, 'PER']),
+                "season": season_advanced.at[best_per_idx, 'SEASON']
+            }
         
         return highlights
         
     except Exception as e:
-        logger.error(f"Error getting career highlights: {e}")
+        logger.error("Error getting career highlights: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1268,58 +1462,58 @@ async def get_player_career_trends(
     """
     try:
         # Determine stat type
-        if stat_name in ['PER', 'TS%', 'WS', 'BPM', 'VORP']:
-            stat_type = "ADVANCED"
-        else:
-            stat_type = "PER_GAME"
+        stat_type = "ADVANCED" if stat_name in ADVANCED_STATS else "PER_GAME"
         
-        stats = brs_get_stats(player_name, stat_type=stat_type, playoffs=False, ask_matches=False)
+        stats = await cached_get_stats(player_name, stat_type=stat_type, playoffs=False)
         
         if stats.empty:
             return {"error": f"No stats found for {player_name}"}
         
         # Get season data
-        season_data = stats[stats['SEASON'] != 'Career'].copy()
+        season_data = split_career(stats)[1]
         
         if stat_name not in season_data.columns:
             return {"error": f"Stat '{stat_name}' not available"}
+        if not pd.api.types.is_numeric_dtype(season_data[stat_name]):
+            return {"error": f"Stat '{stat_name}' is not numeric"}
         
-        # Convert stat to numeric
-        season_data[stat_name] = pd.to_numeric(season_data[stat_name], errors='coerce')
         season_data = season_data.dropna(subset=[stat_name])
+        if season_data.empty:
+            return {"error": f"No {stat_name} values recorded for {player_name}"}
         
         # Calculate trends
         result = {
             "player_name": player_name,
             "stat_analyzed": stat_name,
             "career_progression": season_data[['SEASON', stat_name]].to_dict('records'),
-            "career_average": season_data[stat_name].mean(),
-            "career_peak": season_data[stat_name].max(),
-            "career_low": season_data[stat_name].min()
+            "career_average": to_native(season_data[stat_name].mean()),
+            "career_peak": to_native(season_data[stat_name].max()),
+            "career_low": to_native(season_data[stat_name].min())
         }
         
         # Find peak season
-        peak_idx = season_data[stat_name].idxmax()
-        if pd.notna(peak_idx):
+        peak_idx = best_season_rows(season_data, [stat_name]).get(stat_name)
+        if peak_idx is not None:
             result["peak_season"] = {
-                "season": season_data.loc[peak_idx, 'SEASON'],
-                "value": season_data.loc[peak_idx, stat_name],
-                "age": season_data.loc[peak_idx, 'AGE'] if 'AGE' in season_data.columns else None
+                "season": season_data.at[peak_idx, 'SEASON'],
+                "value": to_native(season_data.at[peak_idx, stat_name]),
+                "age": to_native(season_data.at[peak_idx, 'AGE']) if 'AGE' in season_data.columns else None
             }
         
         # Calculate year-over-year changes
         if len(season_data) > 1:
-            season_data['YoY_change'] = season_data[stat_name].diff()
-            season_data['YoY_pct_change'] = season_data[stat_name].pct_change() * 100
+            # Largest rise and largest drop found in one argmax over the changes and their negation
+            change = season_data[stat_name].diff()
+            swings = best_season_rows(pd.DataFrame({'rise': change, 'drop': -change}), ['rise', 'drop'])
             
             result["biggest_improvement"] = {
-                "season": season_data.loc[season_data['YoY_change'].idxmax(), 'SEASON'],
-                "improvement": season_data['YoY_change'].max()
+                "season": season_data.at[swings['rise'], 'SEASON'],
+                "improvement": to_native(change[swings['rise']])
             }
             
             result["biggest_decline"] = {
-                "season": season_data.loc[season_data['YoY_change'].idxmin(), 'SEASON'],
-                "decline": season_data['YoY_change'].min()
+                "season": season_data.at[swings['drop'], 'SEASON'],
+                "decline": to_native(change[swings['drop']])
             }
         
         # Trend analysis (last 5 years)
@@ -1328,14 +1522,14 @@ async def get_player_career_trends(
             trend = "declining" if recent_seasons[stat_name].iloc[-1] < recent_seasons[stat_name].iloc[0] else "improving"
             result["recent_trend"] = {
                 "direction": trend,
-                "last_5_years_avg": recent_seasons[stat_name].mean(),
-                "current_vs_peak_pct": (season_data[stat_name].iloc[-1] / season_data[stat_name].max()) * 100
+                "last_5_years_avg": to_native(recent_seasons[stat_name].mean()),
+                "current_vs_peak_pct": to_native(season_data[stat_name].iloc[-1] / season_data[stat_name].max() * 100)
             }
         
         return result
         
     except Exception as e:
-        logger.error(f"Error analyzing career trends: {e}")
+        logger.error("Error analyzing career trends: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1357,14 +1551,18 @@ async def get_player_game_highs(
     """
     try:
         # Get career stats
-        per_game = brs_get_stats(player_name, stat_type="PER_GAME", playoffs=False, ask_matches=False)
-        totals = brs_get_stats(player_name, stat_type="TOTALS", playoffs=False, ask_matches=False)
+        per_game, totals = await asyncio.gather(
+            cached_get_stats(player_name, stat_type="PER_GAME", playoffs=False),
+            cached_get_stats(player_name, stat_type="TOTALS", playoffs=False)
+        )
         
         if per_game.empty:
             return {"error": f"No stats found for {player_name}"}
         
-        season_data = per_game[per_game['SEASON'] != 'Career']
-        season_totals = totals[totals['SEASON'] != 'Career']
+        career_pg, season_data = split_career(per_game)
+        career_totals, season_totals = split_career(totals)
+        if career_pg.empty:
+            return {"error": "No career stats found"}
         
         result = {
             "player_name": player_name,
@@ -1373,32 +1571,24 @@ async def get_player_game_highs(
         }
         
         # Find single-game career highs (estimates based on season highs)
-        stats_to_check = {
-            'PTS': 'points',
-            'TRB': 'rebounds',
-            'AST': 'assists',
-            'STL': 'steals',
-            'BLK': 'blocks',
-            '3P': 'three_pointers_made'
-        }
-        
-        for stat, name in stats_to_check.items():
-            if stat in season_data.columns:
-                max_idx = season_data[stat].idxmax()
-                if pd.notna(max_idx):
-                    # Estimate single-game high as ~1.5-2x season average
-                    season_avg = season_data.loc[max_idx, stat]
-                    estimated_high = season_avg * 1.8  # Rough estimate
-                    
-                    result["career_highs"][f"estimated_{name}_high"] = {
-                        "value": round(estimated_high),
-                        "best_season_avg": season_avg,
-                        "season": season_data.loc[max_idx, 'SEASON']
-                    }
+        best_rows = best_season_rows(season_data, list(GAME_HIGH_STATS))
+        for stat, name in GAME_HIGH_STATS.items():
+            if stat in best_rows:
+                max_idx = best_rows[stat]
+                # Estimate single-game high as ~1.5-2x season average
+                season_avg = season_data.at[max_idx, stat]
+                estimated_high = season_avg * 1.8  # Rough estimate
+                
+                result["career_highs"][f"estimated_{name}_high"] = {
+                    "value": round(estimated_high),
+                    "best_season_avg": to_native(season_avg),
+                    "season": season_data.at[max_idx, 'SEASON']
+                }
         
         # Estimate high-scoring games
-        career_ppg = per_game[per_game['SEASON'] == 'Career']['PTS'].values[0]
-        total_games = totals[totals['SEASON'] == 'Career']['G'].values[0]
+        career_ppg = row_value(career_pg, 'PTS')
+        # The PER_GAME Career row carries G too, for when the TOTALS table didn't come back
+        total_games = row_value(career_totals, 'G', row_value(career_pg, 'G'))
         
         # Rough estimates based on career averages
         if career_ppg >= 25:
@@ -1413,8 +1603,8 @@ async def get_player_game_highs(
         
         # Triple-double estimates
         if include_triple_doubles:
-            career_rpg = per_game[per_game['SEASON'] == 'Career']['TRB'].values[0]
-            career_apg = per_game[per_game['SEASON'] == 'Career']['AST'].values[0]
+            career_rpg = row_value(career_pg, 'TRB')
+            career_apg = row_value(career_pg, 'AST')
             
             # Players who average close to triple-doubles have more
             if career_rpg >= 7 and career_apg >= 7:
@@ -1425,15 +1615,17 @@ async def get_player_game_highs(
                 result["milestone_games_estimate"]["triple_doubles"] = int(total_games * 0.001)  # ~0.1%
         
         # Best statistical seasons
-        result["best_scoring_season"] = {
-            "season": season_data.loc[season_data['PTS'].idxmax(), 'SEASON'],
-            "ppg": season_data['PTS'].max()
-        }
+        best_idx = best_season_rows(season_data, ['PTS']).get('PTS')
+        if best_idx is not None:
+            result["best_scoring_season"] = {
+                "season": season_data.at[best_idx, 'SEASON'],
+                "ppg": to_native(season_data.at[best_idx, 'PTS'])
+            }
         
         return result
         
     except Exception as e:
-        logger.error(f"Error getting game highs: {e}")
+        logger.error("Error getting game highs: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1455,19 +1647,19 @@ async def get_player_situational_splits(
     """
     try:
         # Get base stats
-        stats = brs_get_stats(player_name, stat_type="PER_GAME", playoffs=False, ask_matches=False)
+        stats = await cached_get_stats(player_name, stat_type="PER_GAME", playoffs=False)
         
         if stats.empty:
             return {"error": f"No stats found for {player_name}"}
         
         if season:
-            season_str = f"{season-1}-{str(season)[2:]}"
-            season_stats = stats[stats['SEASON'] == season_str]
+            season_str = season_label(season)
+            season_stats = season_rows(stats, season_str)
             if season_stats.empty:
                 return {"error": f"No stats for {season_str}"}
-            base_stats = season_stats.iloc[0]
+            base_stats = row_to_dict(season_stats)
         else:
-            base_stats = stats[stats['SEASON'] == 'Career'].iloc[0]
+            base_stats = row_to_dict(split_career(stats)[0])
             season_str = "Career"
         
         result = {
@@ -1484,58 +1676,25 @@ async def get_player_situational_splits(
         }
         
         # Estimate splits based on typical patterns
-        if split_type == "home_away":
-            # Most players perform ~5-10% better at home
-            result["splits"] = {
-                "home": {
-                    "estimated_ppg": round(base_stats['PTS'] * 1.03, 1),
-                    "estimated_fg_pct": round(float(base_stats.get('FG%', 0)) * 1.02, 1),
-                    "games": int(base_stats['G'] / 2)
-                },
-                "away": {
-                    "estimated_ppg": round(base_stats['PTS'] * 0.97, 1),
-                    "estimated_fg_pct": round(float(base_stats.get('FG%', 0)) * 0.98, 1),
-                    "games": int(base_stats['G'] / 2)
-                }
-            }
-            result["note"] = "Home/away splits are estimates based on typical NBA patterns"
-            
-        elif split_type == "rest_days":
-            # Players typically perform better with rest
+        if split_type in SITUATIONAL_SPLITS:
+            multipliers, note = SITUATIONAL_SPLITS[split_type]
+            ppg, fg_pct = base_stats['PTS'], base_stats.get('FG%', 0)
             result["splits"] = {
-                "0_days_rest": {
-                    "estimated_ppg": round(base_stats['PTS'] * 0.92, 1),
-                    "estimated_fg_pct": round(float(base_stats.get('FG%', 0)) * 0.95, 1)
-                },
-                "1_day_rest": {
-                    "estimated_ppg": round(base_stats['PTS'] * 0.98, 1),
-                    "estimated_fg_pct": round(float(base_stats.get('FG%', 0)) * 0.99, 1)
-                },
-                "2+_days_rest": {
-                    "estimated_ppg": round(base_stats['PTS'] * 1.05, 1),
-                    "estimated_fg_pct": round(float(base_stats.get('FG%', 0)) * 1.02, 1)
+                split: {
+                    "estimated_ppg": round(ppg * ppg_mult, 1),
+                    "estimated_fg_pct": round(fg_pct * fg_mult, 1)
                 }
+                for split, (ppg_mult, fg_mult) in multipliers.items()
             }
-            result["note"] = "Rest day impacts are estimates based on typical fatigue patterns"
-            
-        elif split_type == "win_loss":
-            # Players typically have better stats in wins
-            result["splits"] = {
-                "wins": {
-                    "estimated_ppg": round(base_stats['PTS'] * 1.1, 1),
-                    "estimated_fg_pct": round(float(base_stats.get('FG%', 0)) * 1.08, 1)
-                },
-                "losses": {
-                    "estimated_ppg": round(base_stats['PTS'] * 0.9, 1),
-                    "estimated_fg_pct": round(float(base_stats.get('FG%', 0)) * 0.92, 1)
-                }
-            }
-            result["note"] = "Win/loss splits are estimates; better performance typically correlates with wins"
+            if split_type == "home_away":
+                for split in result["splits"].values():
+                    split["games"] = int(base_stats['G'] / 2)
+            result["note"] = note
         
         return result
         
     except Exception as e:
-        logger.error(f"Error getting situational splits: {e}")
+        logger.error("Error getting situational splits: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1557,23 +1716,23 @@ async def get_player_quarter_stats(
     """
     try:
         # Get base stats
-        stats = brs_get_stats(player_name, stat_type="PER_GAME", playoffs=False, ask_matches=False)
+        stats = await cached_get_stats(player_name, stat_type="PER_GAME", playoffs=False)
         
         if stats.empty:
             return {"error": f"No stats found for {player_name}"}
         
         if season:
-            season_str = f"{season-1}-{str(season)[2:]}"
-            season_stats = stats[stats['SEASON'] == season_str]
+            season_str = season_label(season)
+            season_stats = season_rows(stats, season_str)
             if season_stats.empty:
                 return {"error": f"No stats for {season_str}"}
-            base_stats = season_stats.iloc[0]
+            base_stats = row_to_dict(season_stats)
         else:
-            base_stats = stats[stats['SEASON'] == 'Career'].iloc[0]
+            base_stats = row_to_dict(split_career(stats)[0])
             season_str = "Career"
         
-        ppg = float(base_stats.get('PTS', 0))
-        mpg = float(base_stats.get('MP', 36))  # Minutes per game
+        ppg = base_stats.get('PTS', 0)
+        mpg = base_stats.get('MP', 36)  # Minutes per game
         
         result = {
             "player_name": player_name,
@@ -1612,7 +1771,7 @@ async def get_player_quarter_stats(
         
         # Add usage rate context for 4th quarter
         if quarter == "4th" and 'USG%' in base_stats:
-            result["fourth_quarter"]["estimated_usage_rate"] = round(float(base_stats['USG%']) * 1.15, 1)
+            result["fourth_quarter"]["estimated_usage_rate"] = round(base_stats['USG%'] * 1.15, 1)
             result["fourth_quarter"]["go_to_scorer"] = ppg >= 20
         
         result["note"] = "Quarter splits are estimates based on typical NBA patterns and player role"
@@ -1620,7 +1779,7 @@ async def get_player_quarter_stats(
         return result
         
     except Exception as e:
-        logger.error(f"Error getting quarter stats: {e}")
+        logger.error("Error getting quarter stats: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1639,78 +1798,51 @@ async def get_player_milestone_tracker(
         Current totals, next milestones, and projected achievement dates
     """
     try:
-        # Get career totals
-        totals = brs_get_stats(player_name, stat_type="TOTALS", playoffs=False, ask_matches=False)
-        per_game = brs_get_stats(player_name, stat_type="PER_GAME", playoffs=False, ask_matches=False)
+        # Reject unknown milestone types before fetching anything
+        if milestone_type not in MILESTONES:
+            return {"error": f"Invalid milestone type. Choose from: {list(MILESTONES.keys())}"}
+        
+        milestone_info = MILESTONES[milestone_type]
+        
+        # Get career totals, plus per-game averages for milestones that report one
+        if milestone_info["per_game"]:
+            totals, per_game = await asyncio.gather(
+                cached_get_stats(player_name, stat_type="TOTALS", playoffs=False),
+                cached_get_stats(player_name, stat_type="PER_GAME", playoffs=False)
+            )
+        else:
+            totals = await cached_get_stats(player_name, stat_type="TOTALS", playoffs=False)
         
         if totals.empty:
             return {"error": f"No stats found for {player_name}"}
         
-        career_totals = totals[totals['SEASON'] == 'Career'].iloc[0]
-        career_avg = per_game[per_game['SEASON'] == 'Career'].iloc[0]
-        
-        # Get recent season for projection
-        recent_seasons = totals[totals['SEASON'] != 'Career'].tail(3)
+        career_totals, season_totals = split_career(totals)
         
         result = {
             "player_name": player_name,
             "milestone_type": milestone_type
         }
         
-        # Define milestones
-        milestones = {
-            "points": {
-                "stat": "PTS",
-                "thresholds": [10000, 15000, 20000, 25000, 30000, 35000, 40000],
-                "per_game": "PTS",
-                "name": "career points"
-            },
-            "assists": {
-                "stat": "AST",
-                "thresholds": [5000, 6000, 7000, 8000, 9000, 10000, 12000, 15000],
-                "per_game": "AST",
-                "name": "career assists"
-            },
-            "rebounds": {
-                "stat": "TRB",
-                "thresholds": [5000, 7500, 10000, 12500, 15000, 17500, 20000],
-                "per_game": "TRB",
-                "name": "career rebounds"
-            },
-            "3pm": {
-                "stat": "3P",
-                "thresholds": [1000, 1500, 2000, 2500, 3000, 3500],
-                "per_game": "3P",
-                "name": "three-pointers made"
-            },
-            "games": {
-                "stat": "G",
-                "thresholds": [500, 750, 1000, 1250, 1500],
-                "per_game": None,
-                "name": "games played"
-            }
-        }
-        
-        if milestone_type not in milestones:
-            return {"error": f"Invalid milestone type. Choose from: {list(milestones.keys())}"}
-        
-        milestone_info = milestones[milestone_type]
-        current_total = int(career_totals.get(milestone_info["stat"], 0))
+        current_total = int(row_value(career_totals, milestone_info["stat"]))
         
         result["current_total"] = current_total
-        result["career_average"] = career_avg.get(milestone_info["per_game"], 0) if milestone_info["per_game"] else None
+        result["career_average"] = row_value(split_career(per_game)[0], milestone_info["per_game"]) if milestone_info["per_game"] else None
         
-        # Find next milestones
-        next_milestones = [m for m in milestone_info["thresholds"] if m > current_total]
+        # Find next milestones, thresholds are ascending
+        thresholds = milestone_info["thresholds"]
+        next_milestones = thresholds[bisect.bisect_right(thresholds, current_total):]
         
         if next_milestones:
             result["next_milestone"] = next_milestones[0]
             result["needed_for_next"] = next_milestones[0] - current_total
             
             # Project games needed
-            if milestone_info["per_game"] and len(recent_seasons) > 0:
-                # Average from last 3 seasons
-                recent_avg = recent_seasons[milestone_info["stat"]].sum() / recent_seasons['G'].sum()
+            if milestone_info["per_game"] and not season_totals.empty:
+                # Average from last 3 seasons, summed on the raw array to skip pandas reductions
+                stat_sum, games_sum = np.nansum(
+                    season_totals[[milestone_info["stat"], 'G']].to_numpy(dtype=float)[-3:], axis=0
+                )
+                recent_avg = stat_sum / games_sum
                 games_needed = result["needed_for_next"] / recent_avg if recent_avg > 0 else None
                 
                 if games_needed:
@@ -1729,7 +1861,7 @@ async def get_player_milestone_tracker(
                         result["projected_achievement"] = f"In approximately {seasons} seasons"
             
             # Show multiple upcoming milestones
-            result["upcoming_milestones"] = next_milestones[:3]
+            result["upcoming_milestones"] = list(next_milestones[:3])
         else:
             result["message"] = f"Already achieved all standard {milestone_info['name']} milestones!"
         
@@ -1742,7 +1874,7 @@ async def get_player_milestone_tracker(
         return result
         
     except Exception as e:
-        logger.error(f"Error tracking milestones: {e}")
+        logger.error("Error tracking milestones: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -1761,71 +1893,25 @@ async def get_player_rankings(
         Estimated all-time ranking and context
     """
     try:
+        # Reject unknown categories before fetching anything
+        if category not in RANKING_THRESHOLDS:
+            return {"error": f"Invalid category. Choose from: {list(RANKING_THRESHOLDS.keys())}"}
+        
         # Get career totals
-        totals = brs_get_stats(player_name, stat_type="TOTALS", playoffs=False, ask_matches=False)
+        totals = await cached_get_stats(player_name, stat_type="TOTALS", playoffs=False)
         
         if totals.empty:
             return {"error": f"No stats found for {player_name}"}
         
-        career_totals = totals[totals['SEASON'] == 'Career'].iloc[0]
-        
-        # All-time thresholds for rough ranking estimates
-        ranking_thresholds = {
-            "points": {
-                "stat": "PTS",
-                "thresholds": [
-                    (40000, 1), (38000, 2), (35000, 3), (33000, 4), (32000, 5),
-                    (31000, 6), (30000, 8), (28000, 10), (27000, 12), (26000, 15),
-                    (25000, 20), (23000, 25), (21000, 30), (20000, 35), (19000, 40),
-                    (18000, 50), (15000, 75), (12000, 100), (10000, 150)
-                ],
-                "goat_value": 38387,  # Kareem
-                "goat_name": "Kareem Abdul-Jabbar (38,387)"
-            },
-            "assists": {
-                "stat": "AST",
-                "thresholds": [
-                    (15000, 1), (12000, 2), (11000, 3), (10000, 4), (9000, 5),
-                    (8000, 8), (7000, 12), (6000, 20), (5000, 35), (4000, 60)
-                ],
-                "goat_value": 15806,  # Stockton
-                "goat_name": "John Stockton (15,806)"
-            },
-            "rebounds": {
-                "stat": "TRB",
-                "thresholds": [
-                    (23000, 1), (22000, 2), (21000, 3), (17000, 5), (16000, 8),
-                    (15000, 12), (14000, 15), (13000, 20), (12000, 30), (10000, 50)
-                ],
-                "goat_value": 23924,  # Wilt
-                "goat_name": "Wilt Chamberlain (23,924)"
-            },
-            "3pm": {
-                "stat": "3P",
-                "thresholds": [
-                    (3500, 1), (3000, 2), (2800, 3), (2600, 4), (2400, 5),
-                    (2200, 8), (2000, 12), (1800, 20), (1500, 35), (1000, 100)
-                ],
-                "goat_value": 3747,  # Curry (as of 2024)
-                "goat_name": "Stephen Curry (3,700+)"
-            }
-        }
-        
-        if category not in ranking_thresholds:
-            return {"error": f"Invalid category. Choose from: {list(ranking_thresholds.keys())}"}
-        
-        ranking_info = ranking_thresholds[category]
-        current_total = int(career_totals.get(ranking_info["stat"], 0))
+        career_totals, season_totals = split_career(totals)
         
-        # Estimate ranking
-        estimated_rank = None
-        for threshold, rank in ranking_info["thresholds"]:
-            if current_total >= threshold:
-                estimated_rank = rank
-                break
+        ranking_info = RANKING_THRESHOLDS[category]
+        current_total = int(row_value(career_totals, ranking_info["stat"]))
         
-        if not estimated_rank:
-            estimated_rank = "Outside top 150"
+        # Estimate ranking from the highest cutoff the total reaches
+        cutoffs, ranks = RANK_CUTOFFS[category]
+        position = bisect.bisect_right(cutoffs, current_total)
+        estimated_rank = ranks[position - 1] if position else "Outside top 150"
         
         result = {
             "player_name": player_name,
@@ -1838,26 +1924,17 @@ async def get_player_rankings(
         
         # Add context
         if isinstance(estimated_rank, int):
-            if estimated_rank <= 5:
-                result["context"] = "All-time great in this category"
-            elif estimated_rank <= 10:
-                result["context"] = "Top 10 all-time - legendary status"
-            elif estimated_rank <= 25:
-                result["context"] = "Among the very best to ever play"
-            elif estimated_rank <= 50:
-                result["context"] = "Elite historical standing"
-            else:
-                result["context"] = "Significant career achievement"
+            result["context"] = RANK_CONTEXTS[bisect.bisect_left(RANK_CONTEXT_BOUNDS, estimated_rank)]
         
         # Special notes for active players
-        seasons_played = len(totals[totals['SEASON'] != 'Career'])
+        seasons_played = len(season_totals)
         if seasons_played <= 15:  # Likely still active
             result["note"] = "Still active - ranking will improve"
         
         return result
         
     except Exception as e:
-        logger.error(f"Error getting rankings: {e}")
+        logger.error("Error getting rankings: %s", e, exc_info=True)
         return {"error": str(e)}
 
 
@@ -0,0 +1,78 @@
+"""Shared pytest configuration for the integration tests"""
+
+import contextlib
+import os
+import tempfile
+
+import pytest
+import vcr
+
+# Never read or write the user's cache, cassette tests get a fresh directory each on top of this
+os.environ.setdefault('NBA_STATS_CACHE_DIR', tempfile.mkdtemp(prefix='nba_stats_tests_'))
+
+CASSETTE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cassettes')
+FILTER_HEADERS = ["authorization", "cookie"]
+NO_CASSETTE = "no recorded cassette, run once with --record-mode=once and network access to record it"
+
+
+def pytest_configure(config):
+    # Registered here too so the markers don't warn when pytest-xdist isn't installed
+    config.addinivalue_line("markers", "xdist_group(name): keep tests sharing a session fixture on one worker")
+
+
+def _isolate(monkeypatch, cassette, cache_dir):
+    """Start from empty scraper caches, and drop the rate limit when the cassette only replays
+
+    Each test then sends its own requests through HTTP, which keeps every cassette self-contained
+    whatever order the tests run in.
+    """
+    import fix_basketball_reference
+    import src.server as server
+
+    monkeypatch.setattr(fix_basketball_reference, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(server, "_stats_cache", {})
+    monkeypatch.setattr(server, "_stats_locks", {})
+    fix_basketball_reference._pages.clear()
+    fix_basketball_reference._player_suffix.cache_clear()
+    if cassette.write_protected:
+        monkeypatch.setattr(fix_basketball_reference, "_REQUEST_INTERVAL", 0)
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Only replay recorded basketball-reference responses, recording takes an explicit --record-mode"""
+    return {"filter_headers": FILTER_HEADERS}
+
+
+@pytest.fixture(autouse=True)
+def isolated_replay(request, monkeypatch):
+    """Start each cassette test with empty in-memory caches, and skip rate limiting on pure replay"""
+    cassette = request.getfixturevalue("vcr") if "vcr" in request.fixturenames else None
+    if cassette is None:
+        return
+    path = os.path.join(request.getfixturevalue("vcr_cassette_dir"),
+                        request.getfixturevalue("default_cassette_name") + ".yaml")
+    if cassette.write_protected and not os.path.exists(path):
+        pytest.skip(NO_CASSETTE)
+    _isolate(monkeypatch, cassette, request.getfixturevalue("tmp_path"))
+
+
+@pytest.fixture(scope="session")
+def session_cassette(pytestconfig, tmp_path_factory):
+    """Context manager that replays a session fixture's requests from tests/cassettes/session/<name>.yaml
+
+    Session fixtures are set up before any test's own cassette is active, so they record their own.
+    """
+    record_mode = pytestconfig.getoption("--record-mode") or "none"
+    recorder = vcr.VCR(record_mode=record_mode, filter_headers=FILTER_HEADERS)
+
+    @contextlib.contextmanager
+    def use(name):
+        path = os.path.join(CASSETTE_DIR, "session", f"{name}.yaml")
+        if record_mode == "none" and not os.path.exists(path):
+            pytest.skip(NO_CASSETTE)
+        with recorder.use_cassette(path) as cassette, pytest.MonkeyPatch.context() as monkeypatch:
+            _isolate(monkeypatch, cassette, tmp_path_factory.mktemp(name))
+            yield cassette
+
+    return use
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Offline tests for the NBA Player Stats MCP Server
+
+The scraper is swapped for canned DataFrames, so these run without touching basketball-reference.com
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import os
+import sys
+from pydantic_core import to_json
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.server as server
+
+
+def tool(func):
+    """Underlying coroutine of a tool, older FastMCP releases wrap it in a FunctionTool"""
+    return getattr(func, 'fn', func)
+
+
+def stats_table(seasons, career):
+    """Frame shaped like a scraped table: one row per season dict, then the Career row"""
+    return pd.DataFrame(seasons + [dict(career, SEASON='Career')])
+
+
+# A journeyman with no awards, so AWARDS is blank in every row
+ROLE_PLAYER = {
+    "PER_GAME": stats_table(
+        [
+            {"SEASON": "2019-20", "AGE": 24, "G": 60, "PTS": 8.1, "TRB": 3.2, "AST": 1.5, "AWARDS": np.nan},
+            {"SEASON": "2020-21", "AGE": 25, "G": 71, "PTS": 9.4, "TRB": 3.9, "AST": 1.8, "AWARDS": np.nan},
+        ],
+        {"AGE": np.nan, "G": 131, "PTS": 8.8, "TRB": 3.6, "AST": 1.7, "AWARDS": np.nan},
+    ),
+    "TOTALS": stats_table(
+        [
+            {"SEASON": "2019-20", "AGE": 24, "G": 60, "PTS": 486},
+            {"SEASON": "2020-21", "AGE": 25, "G": 71, "PTS": 667},
+        ],
+        {"AGE": np.nan, "G": 131, "PTS": 1153},
+    ),
+    "ADVANCED": stats_table(
+        [
+            {"SEASON": "2019-20", "AGE": 24, "PER": 11.2},
+            {"SEASON": "2020-21", "AGE": 25, "PER": 12.5},
+        ],
+        {"AGE": np.nan, "PER": 11.9},
+    ),
+}
+
+
+@pytest.fixture
+def fake_scraper(monkeypatch):
+    """Serve ROLE_PLAYER's tables in place of brs_get_stats and record every scrape"""
+    calls = []
+
+    def fetcher(stat_type, playoffs):
+        def fetch(player_name):
+            calls.append((player_name, stat_type, playoffs))
+            return pd.DataFrame() if playoffs else ROLE_PLAYER.get(stat_type, pd.DataFrame()).copy()
+        return fetch
+
+    for stat_type, playoffs in list(server.FETCHERS):
+        monkeypatch.setitem(server.FETCHERS, (stat_type, playoffs), fetcher(stat_type, playoffs))
+    monkeypatch.setattr(server, "_stats_cache", {})
+    monkeypatch.setattr(server, "_stats_locks", {})
+    return calls
+
+
+class TestStatsCache:
+    """Test the scraper result cache"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_uses_cache(self, fake_scraper):
+        """Test that a repeated query, whatever its case and spacing, scrapes the table once"""
+        first = await tool(server.get_player_totals)("Role Player")
+        second = await tool(server.get_player_totals)("  role player ")
+
+        assert second["career_totals"]["PTS"] == first["career_totals"]["PTS"]
+        assert second["career_totals"]["G"] == first["career_totals"]["G"]
+        assert len(fake_scraper) == len({(stat_type, playoffs) for _, stat_type, playoffs in fake_scraper})
+        assert ("role player", "TOTALS", False) in server._stats_cache
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self, fake_scraper, monkeypatch):
+        """Test that an entry older than STATS_CACHE_TTL is scraped again"""
+        monkeypatch.setattr(server, "STATS_CACHE_TTL", 0)
+        for _ in range(2):
+            await server.cached_get_stats("Role Player", stat_type="TOTALS")
+
+        assert fake_scraper.count(("Role Player", "TOTALS", False)) == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_result_is_not_cached(self, fake_scraper):
+        """Test that an empty scrape, e.g. a rate-limited one, is retried instead of cached"""
+        for _ in range(2):
+            stats = await server.cached_get_stats("Role Player", stat_type="PER_GAME", playoffs=True)
+            assert stats.empty
+
+        assert fake_scraper.count(("Role Player", "PER_GAME", True)) == 2
+        assert ("role player", "PER_GAME", True) not in server._stats_cache
+
+
+class TestCareerHighlights:
+    """Test the career highlights summary"""
+
+    @pytest.mark.asyncio
+    async def test_player_without_awards(self, fake_scraper):
+        """Test that a blank AWARDS column counts as zero All-Star appearances"""
+        highlights = await tool(server.get_player_career_highlights)("Role Player")
+
+        assert "error" not in highlights
+        assert highlights["all_star_appearances"] == 0
+        assert highlights["career_overview"]["seasons_played"] == 2
+        assert highlights["best_per_season"]["season"] == "2020-21"
+
+
+class TestCareerTrends:
+    """Test career trend analysis"""
+
+    @pytest.mark.asyncio
+    async def test_integer_stat_trends_serialize(self, fake_scraper):
+        """Test that trends on an integer stat return plain Python numbers FastMCP can serialize"""
+        trends = await tool(server.get_player_career_trends)("Role Player", stat_name="G")
+
+        assert "error" not in trends
+        assert trends["career_peak"] == 71 and type(trends["career_peak"]) is int
+        assert trends["peak_season"] == {"season": "2020-21", "value": 71, "age": 25}
+        assert trends["biggest_improvement"]["improvement"] == 11
+        to_json(trends)
+
+
+class TestGameHighs:
+    """Test the game highs estimates"""
+
+    @pytest.mark.asyncio
+    async def test_missing_totals_table(self, fake_scraper, monkeypatch):
+        """Test that an empty TOTALS table falls back to the games played in the PER_GAME Career row"""
+        monkeypatch.setitem(server.FETCHERS, ("TOTALS", False), lambda player_name: pd.DataFrame())
+        highs = await tool(server.get_player_game_highs)("Role Player")
+
+        assert "error" not in highs
+        assert highs["milestone_games_estimate"]["40_point_games"] == int(131 * 0.005)
+        to_json(highs)
+
+    @pytest.mark.asyncio
+    async def test_missing_career_row(self, fake_scraper, monkeypatch):
+        """Test that a table without its Career row returns the usual error instead of an IndexError"""
+        seasons_only = ROLE_PLAYER["PER_GAME"].iloc[:-1]
+        monkeypatch.setitem(server.FETCHERS, ("PER_GAME", False), lambda player_name: seasons_only.copy())
+        highs = await tool(server.get_player_game_highs)("Role Player")
+
+        assert highs == {"error": "No career stats found"}
+
+
+# Run tests if executed directly
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])